@@ -1 +1 @@
-"""Flask server implementations."""
+"""Quart server implementations."""
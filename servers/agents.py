@@ -1,59 +1,57 @@
-"""Flask servers for individual agents."""
+"""Quart servers for individual agents."""
 
-import json
+import orjson
+from quart import request
 
-from flask import request
+from src.cenotium.agents.perplexity import perplexity_tool
+from src.cenotium.agents.twilio import twilio_tool
 
-from .base import create_flask_app, sse_response
+from .base import create_flask_app, serve, sse_event, sse_response
 
 
 def create_perplexity_server():
-    """Create Flask app for Perplexity agent."""
+    """Create Quart app for Perplexity agent."""
     app = create_flask_app(__name__)
 
     @app.route("/stream", methods=["GET"])
-    def stream():
-        from src.cenotium.agents.perplexity import perplexity_tool
-
+    async def stream():
         query = request.args.get("query", "Default search query")
 
-        def generate():
-            result = perplexity_tool.func(query)
-            yield f"data: {json.dumps({'result': result})}\n\n"
+        async def generate():
+            result = await perplexity_tool.ainvoke(query)
+            yield sse_event({"result": result})
 
         return sse_response(generate())
 
     @app.route("/health", methods=["GET"])
-    def health():
+    async def health():
         return {"status": "ok", "agent": "perplexity"}
 
     return app
 
 
 def create_twilio_server():
-    """Create Flask app for Twilio agent."""
+    """Create Quart app for Twilio agent."""
     app = create_flask_app(__name__)
 
     @app.route("/stream", methods=["GET"])
-    def stream():
-        from src.cenotium.agents.twilio import twilio_tool
-
+    async def stream():
         query = request.args.get(
             "query", '{"to_number": "+14709977644", "message": "Test call"}'
         )
 
-        def generate():
+        async def generate():
             try:
-                data = json.loads(query)
-            except json.JSONDecodeError:
+                data = orjson.loads(query)
+            except orjson.JSONDecodeError:
                 data = {"to_number": "+14709977644", "message": "Test call"}
-            result = twilio_tool.run(data)
-            yield f"data: {json.dumps({'result': result})}\n\n"
+            result = await twilio_tool.ainvoke(data)
+            yield sse_event({"result": result})
 
         return sse_response(generate())
 
     @app.route("/health", methods=["GET"])
-    def health():
+    async def health():
         return {"status": "ok", "agent": "twilio"}
 
     return app
@@ -64,11 +62,11 @@ twilio_app = create_twilio_server()
 
 
 def run_perplexity_server(port: int = 7000):
-    perplexity_app.run(debug=True, port=port)
+    serve(perplexity_app, port=port)
 
 
 def run_twilio_server(port: int = 6000):
-    twilio_app.run(debug=True, port=port)
+    serve(twilio_app, port=port)
 
 
 if __name__ == "__main__":
@@ -1,18 +1,21 @@
-"""Base utilities for Flask SSE servers."""
+"""Base utilities for Quart SSE servers."""
 
 import asyncio
-import json
-from typing import Any, AsyncGenerator, Callable, Generator
+import os
+from typing import Any, AsyncGenerator, Callable, Generator, Iterable, List, Optional
 
-from flask import Flask, Response, stream_with_context
-from flask_cors import CORS
+import orjson
+from hypercorn.asyncio import serve as hypercorn_serve
+from hypercorn.config import Config
+from quart import Quart, Response
+from quart_cors import cors
 
 
-def create_flask_app(name: str = __name__, enable_cors: bool = True) -> Flask:
-    """Create a Flask app with optional CORS support."""
-    app = Flask(name)
+def create_flask_app(name: str = __name__, enable_cors: bool = True) -> Quart:
+    """Create a Quart app with optional CORS support."""
+    app = Quart(name)
     if enable_cors:
-        CORS(app)
+        app = cors(app)
     return app
 
 
@@ -25,41 +28,129 @@ def default_serializer(obj: Any) -> Any:
     return str(obj)
 
 
+SSE_JSON_OPTIONS = (
+    orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+)
+
+
+def sse_event(
+    item: Any, serializer: Callable[[Any], Any] = default_serializer
+) -> bytes:
+    """Serialize an item into a single SSE `data:` frame."""
+    return (
+        b"data: "
+        + orjson.dumps(item, default=serializer, option=SSE_JSON_OPTIONS)
+        + b"\n\n"
+    )
+
+
 def create_sse_stream(
     generator_fn: Callable[[], Generator],
     serializer: Callable[[Any], Any] = default_serializer,
-) -> Generator[str, None, None]:
+) -> Generator[bytes, None, None]:
     """Create an SSE stream from a generator function."""
     for item in generator_fn():
-        yield f"data: {json.dumps(item, default=serializer)}\n\n"
+        yield sse_event(item, serializer)
 
 
-def create_async_sse_stream(
+async def create_async_sse_stream(
     async_generator_fn: Callable[[], AsyncGenerator],
     serializer: Callable[[Any], Any] = default_serializer,
     timeout: int = 120,
-) -> Generator[str, None, None]:
-    """Create an SSE stream from an async generator with timeout."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-
+) -> AsyncGenerator[bytes, None]:
+    """Create an SSE stream from an async generator with a per-item timeout."""
+    gen = async_generator_fn()
     try:
-        gen = async_generator_fn()
         while True:
             try:
-                item = loop.run_until_complete(
-                    asyncio.wait_for(gen.__anext__(), timeout=timeout)
-                )
-                yield f"data: {json.dumps(item, default=serializer)}\n\n"
+                item = await asyncio.wait_for(anext(gen), timeout=timeout)
             except StopAsyncIteration:
                 break
             except asyncio.TimeoutError:
-                yield f"data: {json.dumps({'error': 'Timeout reached'})}\n\n"
+                yield sse_event({"error": "Timeout reached"})
                 break
+            yield sse_event(item, serializer)
     finally:
-        loop.close()
+        await gen.aclose()
+
+
+class RingBuffer:
+    """Bounded event buffer for a single event loop that drops the oldest item.
+
+    Capacity is rounded up to a power of two so slots are addressed with a
+    mask; producers never block and a full buffer overwrites its oldest entry.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        size = 1 << max(capacity - 1, 0).bit_length()
+        self._slots: List[Any] = [None] * size
+        self._mask = size - 1
+        self._head = 0
+        self._tail = 0
+        self._ready = asyncio.Event()
+
+    def __len__(self) -> int:
+        return self._tail - self._head
+
+    def empty(self) -> bool:
+        return self._head == self._tail
+
+    def put_nowait(self, item: Any):
+        if self._tail - self._head > self._mask:
+            self._head += 1
+        self._slots[self._tail & self._mask] = item
+        self._tail += 1
+        self._ready.set()
+
+    def get_nowait(self) -> Any:
+        if self._head == self._tail:
+            raise asyncio.QueueEmpty
+        slot = self._head & self._mask
+        item = self._slots[slot]
+        self._slots[slot] = None
+        self._head += 1
+        return item
+
+    async def get(self) -> Any:
+        while self._head == self._tail:
+            self._ready.clear()
+            await self._ready.wait()
+        return self.get_nowait()
+
+
+def sse_response(generator: Iterable) -> Response:
+    """Create an SSE response from a (sync or async) generator."""
+    response = Response(generator, mimetype="text/event-stream")
+    response.timeout = None
+    return response
+
+
+def serve(
+    app: Quart,
+    host: str = "127.0.0.1",
+    port: int = 5000,
+    debug: Optional[bool] = None,
+):
+    """Serve an app with Hypercorn, on uvloop when it is available.
+
+    Debug mode and the reloader are off unless `debug` is set or
+    CENOTIUM_ENV=development.
+    """
+    if debug is None:
+        debug = os.getenv("CENOTIUM_ENV") == "development"
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
 
+    if debug:
+        # hypercorn.asyncio.serve ignores use_reloader; Quart's dev runner
+        # watches the source tree and restarts the process on changes.
+        app.run(host=host, port=port, debug=True, use_reloader=True)
+        return
 
-def sse_response(generator: Generator) -> Response:
-    """Create an SSE response from a generator."""
-    return Response(stream_with_context(generator), mimetype="text/event-stream")
+    config = Config()
+    config.bind = [f"{host}:{port}"]
+    asyncio.run(hypercorn_serve(app, config))
@@ -1,28 +1,32 @@
-"""Flask server for LLM Compiler streaming."""
+"""Quart server for LLM Compiler streaming."""
 
-from flask import request
+import asyncio
+import functools
 
-from .base import create_async_sse_stream, create_flask_app, sse_response
+from quart import request
+
+from .base import create_async_sse_stream, create_flask_app, serve, sse_response
 
 app = create_flask_app(__name__)
 
 
+@functools.cache
 def get_compiler():
-    """Import and create compiler instance."""
+    """Import and create the shared compiler instance."""
     from src.cenotium.compiler import LLMCompiler
 
     return LLMCompiler()
 
 
 @app.route("/stream", methods=["GET"])
-def stream():
+async def stream():
     """Stream compiler output as SSE."""
     query = request.args.get(
         "query",
         "Plan a trip to Cabo for 8 people, under $1500/person, 5 nights, 6 days.",
     )
 
-    compiler = get_compiler()
+    compiler = await asyncio.to_thread(get_compiler)
 
     async def generate():
         async for step in compiler.astream(query):
@@ -32,13 +36,13 @@ def stream():
 
 
 @app.route("/health", methods=["GET"])
-def health():
+async def health():
     """Health check endpoint."""
     return {"status": "ok"}
 
 
 def main():
-    app.run(debug=True, port=5000)
+    serve(app, port=5000)
 
 
 if __name__ == "__main__":
@@ -1,16 +1,14 @@
-"""Flask server for agent orchestration and monitoring."""
+"""Quart server for agent orchestration and monitoring."""
 
+import asyncio
 import base64
-import json
 import logging
-import queue
-import threading
-import time
 from datetime import datetime
+from typing import AsyncGenerator, Callable, Optional, Set
 
-from flask import Response, jsonify
+from quart import jsonify
 
-from .base import create_flask_app
+from .base import RingBuffer, create_flask_app, serve, sse_event, sse_response
 
 logging.basicConfig(
     level=logging.INFO,
@@ -21,12 +19,15 @@ logger = logging.getLogger(__name__)
 
 app = create_flask_app(__name__)
 
-cognitive_stream_queue = queue.Queue()
-security_events_queue = queue.Queue()
-agent_metrics_queue = queue.Queue()
-inter_agent_queue = queue.Queue()
+cognitive_stream_queue = RingBuffer()
+security_events_queue = RingBuffer()
+inter_agent_queue = RingBuffer()
+
+security_event_subscribers: Set[RingBuffer] = set()
+agent_metrics_subscribers: Set[RingBuffer] = set()
 
 _security_protocol = None
+_serving_loop: Optional[asyncio.AbstractEventLoop] = None
 
 
 def get_security_protocol():
@@ -38,81 +39,104 @@ def get_security_protocol():
     return _security_protocol
 
 
-def log_security_event(event: dict):
-    """Log a security event to the queue."""
+def _seal(payload: dict) -> dict:
+    """Timestamp, encrypt and sign a payload into a base64-encoded entry."""
     protocol = get_security_protocol()
-    event_with_timestamp = {**event, "timestamp": datetime.now().isoformat()}
-    encrypted = protocol.encrypt_message(event_with_timestamp)
-    signature = protocol.sign_message(event_with_timestamp)
-    security_events_queue.put(
-        {
-            "encrypted_data": encrypted,
-            "signature": signature,
-            "timestamp": datetime.now().isoformat(),
-        }
-    )
+    timestamp = datetime.now().isoformat()
+    payload = {**payload, "timestamp": timestamp}
+    encrypted = protocol.encrypt_message(payload)
+    return {
+        "encrypted_data": base64.b64encode(encrypted).decode("ascii"),
+        "signature": protocol.sign_message(payload),
+        "timestamp": timestamp,
+    }
+
+
+@app.before_serving
+async def _capture_serving_loop():
+    global _serving_loop
+    _serving_loop = asyncio.get_running_loop()
+
+
+@app.after_serving
+async def _release_serving_loop():
+    global _serving_loop
+    _serving_loop = None
+
+
+def _call_on_loop(callback: Callable, *args):
+    """Run a callback on the serving loop, handing it over from other threads."""
+    loop = _serving_loop
+    if loop is None:
+        callback(*args)
+        return
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        callback(*args)
+    else:
+        loop.call_soon_threadsafe(callback, *args)
+
+
+def _publish(subscribers: Set[RingBuffer], entry: dict):
+    """Serialize an entry once and fan the frame out to every subscriber."""
+    frame = sse_event(entry)
+    for subscriber in subscribers:
+        subscriber.put_nowait(frame)
+
+
+async def _subscribe(subscribers: Set[RingBuffer]) -> AsyncGenerator[bytes, None]:
+    """Yield published frames until the client disconnects."""
+    frames = RingBuffer()
+    subscribers.add(frames)
+    try:
+        while True:
+            yield await frames.get()
+    finally:
+        subscribers.discard(frames)
+
+
+def _enqueue_security_event(entry: dict):
+    security_events_queue.put_nowait(entry)
+    _publish(security_event_subscribers, entry)
+
+
+def log_security_event(event: dict):
+    """Log a security event to the queue and stream subscribers.
+
+    Safe to call from any thread: the payload is sealed by the caller and the
+    buffers are only touched on the serving loop.
+    """
+    _call_on_loop(_enqueue_security_event, _seal(event))
 
 
 def log_agent_metrics(metrics: dict):
-    """Log agent metrics to the queue."""
-    protocol = get_security_protocol()
-    metrics_with_timestamp = {**metrics, "timestamp": datetime.now().isoformat()}
-    encrypted = protocol.encrypt_message(metrics_with_timestamp)
-    signature = protocol.sign_message(metrics_with_timestamp)
-    agent_metrics_queue.put(
-        {
-            "encrypted_data": encrypted,
-            "signature": signature,
-            "timestamp": datetime.now().isoformat(),
-        }
-    )
+    """Publish agent metrics to stream subscribers from any thread."""
+    _call_on_loop(_publish, agent_metrics_subscribers, _seal(metrics))
 
 
 @app.route("/stream/security-events")
-def security_events_stream():
+async def security_events_stream():
     """Stream encrypted security events."""
-
-    def generate():
-        while True:
-            event = security_events_queue.get()
-            if isinstance(event.get("encrypted_data"), bytes):
-                event["encrypted_data"] = base64.b64encode(
-                    event["encrypted_data"]
-                ).decode("utf-8")
-            yield f"data: {json.dumps(event)}\n\n"
-
-    return Response(generate(), mimetype="text/event-stream")
+    return sse_response(_subscribe(security_event_subscribers))
 
 
 @app.route("/stream/agent-metrics")
-def agent_metrics_stream():
+async def agent_metrics_stream():
     """Stream encrypted agent metrics."""
-
-    def generate():
-        while True:
-            metrics = agent_metrics_queue.get()
-            if isinstance(metrics.get("encrypted_data"), bytes):
-                metrics["encrypted_data"] = base64.b64encode(
-                    metrics["encrypted_data"]
-                ).decode("utf-8")
-            yield f"data: {json.dumps(metrics)}\n\n"
-
-    return Response(generate(), mimetype="text/event-stream")
+    return sse_response(_subscribe(agent_metrics_subscribers))
 
 
 @app.route("/decoded/security-events", methods=["GET"])
-def fetch_decoded_security_event():
+async def fetch_decoded_security_event():
     """Fetch and decode a security event."""
     protocol = get_security_protocol()
     if security_events_queue.empty():
         return jsonify({"message": "No security events available"})
 
-    raw_event = security_events_queue.get()
-    if isinstance(raw_event.get("encrypted_data"), bytes):
-        raw_event["encrypted_data"] = base64.b64encode(
-            raw_event["encrypted_data"]
-        ).decode("utf-8")
-
+    raw_event = security_events_queue.get_nowait()
     raw_encrypted = base64.b64decode(raw_event["encrypted_data"])
     decrypted = protocol.decrypt_message(raw_encrypted)
     signature_valid = protocol.verify_signature(
@@ -122,11 +146,11 @@ def fetch_decoded_security_event():
 
 
 @app.route("/health", methods=["GET"])
-def health():
+async def health():
     return {"status": "ok"}
 
 
-def simulate_events():
+async def simulate_events():
     """Generate sample events for testing."""
     while True:
         log_security_event(
@@ -144,15 +168,18 @@ def simulate_events():
                 "performance_metrics": {"response_time": 150, "success_rate": 0.95},
             }
         )
-        time.sleep(4)
+        await asyncio.sleep(4)
 
 
 def main(port: int = 8080, simulate: bool = False):
     if simulate:
-        simulator = threading.Thread(target=simulate_events, daemon=True)
-        simulator.start()
+
+        @app.before_serving
+        async def start_simulator():
+            app.add_background_task(simulate_events)
+
     logger.info(f"Starting orchestrator on port {port}")
-    app.run(host="0.0.0.0", port=port, debug=False, threaded=True)
+    serve(app, host="0.0.0.0", port=port)
 
 
 if __name__ == "__main__":
@@ -12,16 +12,16 @@ class LoggingCallbackHandler(BaseCallbackHandler):
         self.logger = logger or logging.getLogger(__name__)
 
     def on_llm_start(self, serialized, prompts, **kwargs):
-        self.logger.info(f"LLM started with prompts: {prompts}")
+        self.logger.info("LLM started with prompts: %s", prompts)
 
     def on_llm_end(self, response, **kwargs):
-        self.logger.info(f"LLM ended with response: {response}")
+        self.logger.info("LLM ended with response: %s", response)
 
     def on_tool_start(self, serialized, input_str, **kwargs):
-        self.logger.info(f"Tool started with input: {input_str}")
+        self.logger.info("Tool started with input: %s", input_str)
 
     def on_tool_end(self, output, **kwargs):
-        self.logger.info(f"Tool ended with output: {output}")
+        self.logger.info("Tool ended with output: %s", output)
 
     def on_text(self, text, **kwargs):
-        self.logger.info(f"Agent generated text: {text}")
+        self.logger.info("Agent generated text: %s", text)
@@ -1,7 +1,7 @@
 """Shared Pydantic models for ReAct agents."""
 
 import operator
-from typing import Annotated, List, Tuple, Union
+from typing import Annotated, List, Union
 
 from pydantic import BaseModel, Field
 from typing_extensions import TypedDict
@@ -12,7 +12,9 @@ class PlanExecute(TypedDict):
 
     input: str
     plan: List[str]
-    past_steps: Annotated[List[Tuple], operator.add]
+    plan_str: str
+    past_task_names: Annotated[List[str], operator.add]
+    past_outputs: Annotated[List[str], operator.add]
     response: str
 
 
@@ -1,8 +1,9 @@
 """Shared ReAct agent workflow for plan-and-execute pattern."""
 
 import asyncio
+import functools
 import logging
-from typing import List
+from typing import AsyncGenerator, List
 
 from dotenv import load_dotenv
 from langchain_core.callbacks import CallbackManager
@@ -47,6 +48,40 @@ Otherwise, fill out the plan. Only add steps to the plan that still NEED to be d
 Do not return previously done steps as part of the plan."""
 
 
+_PLANNER_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        ("system", PLANNER_SYSTEM_PROMPT),
+        ("placeholder", "{messages}"),
+    ]
+)
+_REPLANNER_PROMPT = ChatPromptTemplate.from_template(REPLANNER_TEMPLATE)
+
+
+@functools.lru_cache(maxsize=8)
+def _planner_for(model: str):
+    """Planner chain shared by every workflow using the same model."""
+    return _PLANNER_PROMPT | ChatOpenAI(
+        model=model, temperature=0
+    ).with_structured_output(Plan)
+
+
+@functools.lru_cache(maxsize=8)
+def _replanner_for(model: str):
+    """Replanner chain shared by every workflow using the same model."""
+    return _REPLANNER_PROMPT | ChatOpenAI(
+        model=model, temperature=0
+    ).with_structured_output(Act)
+
+
+_STEP_PREFIXES = tuple(f"{i}. " for i in range(1, 256))
+
+
+def _format_plan(steps: List[str]) -> str:
+    if len(steps) > len(_STEP_PREFIXES):
+        return "\n".join([f"{i + 1}. {step}" for i, step in enumerate(steps)])
+    return "\n".join([_STEP_PREFIXES[i] + step for i, step in enumerate(steps)])
+
+
 class ReactWorkflow:
     """ReAct workflow for plan-and-execute agents."""
 
@@ -69,48 +104,35 @@ class ReactWorkflow:
             llm, tools, state_modifier=system_prompt
         ).with_config(callback_manager=callback_manager, verbose=True)
 
-        self.planner = self._create_planner()
-        self.replanner = self._create_replanner()
+        self.planner = _planner_for(model)
+        self.replanner = _replanner_for(model)
         self.workflow = self._build_workflow()
 
-    def _create_planner(self):
-        planner_prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", PLANNER_SYSTEM_PROMPT),
-                ("placeholder", "{messages}"),
-            ]
-        )
-        return planner_prompt | ChatOpenAI(
-            model=self.model, temperature=0
-        ).with_structured_output(Plan)
-
-    def _create_replanner(self):
-        replanner_prompt = ChatPromptTemplate.from_template(REPLANNER_TEMPLATE)
-        return replanner_prompt | ChatOpenAI(
-            model=self.model, temperature=0
-        ).with_structured_output(Act)
-
     async def _execute_step(self, state: PlanExecute):
-        plan = state["plan"]
-        plan_str = "\n".join(f"{i + 1}. {step}" for i, step in enumerate(plan))
-        task = plan[0]
+        plan_str = state["plan_str"]
+        task = state["plan"][0]
         task_formatted = f"For the following plan:\n{plan_str}\n\nYou are tasked with executing step 1: {task}."
         agent_response = await self.agent_executor.ainvoke(
             {"messages": [("user", task_formatted)]}
         )
         return {
-            "past_steps": [(task, agent_response["messages"][-1].content)],
+            "past_task_names": [task],
+            "past_outputs": [agent_response["messages"][-1].content],
         }
 
     async def _plan_step(self, state: PlanExecute):
         plan = await self.planner.ainvoke({"messages": [("user", state["input"])]})
-        return {"plan": plan.steps}
+        return {"plan": plan.steps, "plan_str": _format_plan(plan.steps)}
 
     async def _replan_step(self, state: PlanExecute):
-        output = await self.replanner.ainvoke(state)
+        past_steps = list(zip(state["past_task_names"], state["past_outputs"]))
+        output = await self.replanner.ainvoke(
+            {"input": state["input"], "plan": state["plan"], "past_steps": past_steps}
+        )
         if isinstance(output.action, Response):
             return {"response": output.action.response}
-        return {"plan": output.action.steps}
+        steps = output.action.steps
+        return {"plan": steps, "plan_str": _format_plan(steps)}
 
     def _should_end(self, state: PlanExecute):
         if "response" in state and state["response"]:
@@ -131,27 +153,36 @@ class ReactWorkflow:
 
         return workflow.compile()
 
-    async def arun(self, query: str, context: str = "") -> dict:
-        """Run the workflow asynchronously."""
+    def _prepare_inputs(self, query: str, context: str) -> dict:
         if not query.strip():
             raise ValueError("Query cannot be empty")
 
         self.replanning_attempts = 1
         prompt = f"User Query: {query}\nUser Context: {context}" if context else query
+        return {"input": prompt}
 
+    async def astream(
+        self, query: str, context: str = ""
+    ) -> AsyncGenerator[dict, None]:
+        """Yield each node's state update as the workflow runs."""
+        inputs = self._prepare_inputs(query, context)
         config = {"recursion_limit": 50}
-        inputs = {"input": prompt}
 
+        async for event in self.workflow.astream(inputs, config=config):
+            for k, v in event.items():
+                if k != "__end__":
+                    yield v
+
+    async def arun(self, query: str, context: str = "") -> dict:
+        """Run the workflow asynchronously."""
         try:
-            responses = []
-            async for event in self.workflow.astream(inputs, config=config):
-                for k, v in event.items():
-                    if k != "__end__":
-                        responses.append(v)
+            last = None
+            async for update in self.astream(query, context):
+                last = update
 
             return {
                 "status": "success",
-                "response": responses[-1].get("response") if responses else None,
+                "response": (last or {}).get("response"),
                 "attempts": self.replanning_attempts,
             }
         except GraphRecursionError:
@@ -1,26 +1,152 @@
 """Grounding utilities for browser automation."""
 
+import functools
 import re
+from itertools import islice
 
-from PIL import ImageDraw
+import numpy as np
+from PIL import Image, ImageColor
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+_BOX_START = "<|box_start|>"
+_BOX_END = "<|box_end|>"
+_NUM_RE = re.compile(r"\d+\.\d+|\d+")
+
+
+def _scan_numbers(buf, out):
+    """Parse up to len(out) unsigned decimals from an ASCII byte buffer.
+
+    Mirrors `_NUM_RE`: a run of digits, optionally followed by `.` and more
+    digits. Returns the number of values written to `out`.
+    """
+    n = buf.shape[0]
+    count = 0
+    i = 0
+    while i < n and count < out.shape[0]:
+        c = buf[i]
+        if c < 48 or c > 57:
+            i += 1
+            continue
+        mantissa = 0.0
+        while i < n and 48 <= buf[i] <= 57:
+            mantissa = mantissa * 10.0 + (buf[i] - 48)
+            i += 1
+        scale = 1.0
+        if i + 1 < n and buf[i] == 46 and 48 <= buf[i + 1] <= 57:
+            i += 1
+            while i < n and 48 <= buf[i] <= 57:
+                mantissa = mantissa * 10.0 + (buf[i] - 48)
+                scale *= 10.0
+                i += 1
+        out[count] = mantissa / scale
+        count += 1
+    return count
+
+
+def _scan_batch(data, offsets, out):
+    """Write the bbox midpoint of each `data[offsets[i]:offsets[i + 1]]` to `out`."""
+    for i in prange(offsets.shape[0] - 1):
+        values = np.empty(4)
+        count = _scan_numbers(data[offsets[i] : offsets[i + 1]], values)
+        if count == 2:
+            out[i, 0] = values[0]
+            out[i, 1] = values[1]
+        elif count >= 4:
+            out[i, 0] = (values[0] + values[2]) // 2
+            out[i, 1] = (values[1] + values[3]) // 2
+
+
+if njit is not None:
+    _scan_numbers = njit(cache=True)(_scan_numbers)
+    _scan_batch = njit(cache=True, parallel=True)(_scan_batch)
+    _scan_batch(
+        np.frombuffer(b"0,0,1,1", dtype=np.uint8),
+        np.array([0, 7], dtype=np.int64),
+        np.empty((1, 2)),
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _disc(radius):
+    yy, xx = np.ogrid[-radius : radius + 1, -radius : radius + 1]
+    return xx * xx + yy * yy <= radius * radius
+
+
+def draw_big_dots(image, coordinates, color="red", radius=12):
+    """Draw a large dot on an image at each of the given coordinates."""
+    if image.mode not in ("RGB", "RGBA", "L"):
+        image = image.convert("RGB")
+    pixels = np.array(image)
+    fill = ImageColor.getcolor(color, image.mode)
+    mask = _disc(radius)
+    height, width = pixels.shape[:2]
+
+    for x, y in coordinates:
+        x0, y0 = int(round(x)) - radius, int(round(y)) - radius
+        top, left = max(y0, 0), max(x0, 0)
+        bottom = min(y0 + 2 * radius + 1, height)
+        right = min(x0 + 2 * radius + 1, width)
+        if top < bottom and left < right:
+            region = mask[top - y0 : bottom - y0, left - x0 : right - x0]
+            pixels[top:bottom, left:right][region] = fill
+
+    return Image.fromarray(pixels)
 
 
 def draw_big_dot(image, coordinates, color="red", radius=12):
     """Draw a large dot on an image at the given coordinates."""
-    draw = ImageDraw.Draw(image)
-    x, y = coordinates
-    bounding_box = [x - radius, y - radius, x + radius, y + radius]
-    draw.ellipse(bounding_box, fill=color, outline=color)
-    return image
+    return draw_big_dots(image, [coordinates], color, radius)
+
+
+def _bbox_inner_text(bbox_response):
+    start = bbox_response.find(_BOX_START)
+    if start != -1:
+        start += len(_BOX_START)
+        end = bbox_response.find(_BOX_END, start)
+        if end != -1:
+            return bbox_response[start:end]
+    return bbox_response
+
+
+def _parse_numbers(text, limit=4):
+    if njit is None:
+        return [float(num.group()) for num in islice(_NUM_RE.finditer(text), limit)]
+    out = np.empty(limit)
+    count = _scan_numbers(np.frombuffer(text.encode(), dtype=np.uint8), out)
+    return out[:count].tolist()
 
 
 def extract_bbox_midpoint(bbox_response):
     """Extract the midpoint from a bounding box response."""
-    match = re.search(r"<\|box_start\|>(.*?)<\|box_end\|>", bbox_response)
-    inner_text = match.group(1) if match else bbox_response
-    numbers = [float(num) for num in re.findall(r"\d+\.\d+|\d+", inner_text)]
+    numbers = _parse_numbers(_bbox_inner_text(bbox_response))
     if len(numbers) == 2:
         return numbers[0], numbers[1]
     elif len(numbers) >= 4:
         return (numbers[0] + numbers[2]) // 2, (numbers[1] + numbers[3]) // 2
     return None
+
+
+def extract_bbox_midpoints_batch(bbox_responses):
+    """Extract midpoints from many bounding box responses at once.
+
+    Returns an (N, 2) float array; rows without a midpoint are NaN.
+    """
+    out = np.full((len(bbox_responses), 2), np.nan)
+    if njit is None:
+        for i, bbox_response in enumerate(bbox_responses):
+            midpoint = extract_bbox_midpoint(bbox_response)
+            if midpoint is not None:
+                out[i] = midpoint
+        return out
+
+    encoded = [_bbox_inner_text(response).encode() for response in bbox_responses]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(chunk) for chunk in encoded], out=offsets[1:])
+    data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    _scan_batch(data, offsets, out)
+    return out
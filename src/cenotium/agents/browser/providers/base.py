@@ -1,13 +1,18 @@
 """Base LLM provider classes for browser agent."""
 
 import base64
-import io
-import json
-import re
 
+import orjson
 from anthropic import Anthropic
 from openai import OpenAI
-from PIL import Image
+
+IMAGE_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"\xff\xd8\xff", "jpeg"),
+    (b"GIF87a", "gif"),
+    (b"GIF89a", "gif"),
+    (b"BM", "bmp"),
+)
 
 
 def Message(content, role="assistant"):
@@ -18,10 +23,54 @@ def Text(text):
     return {"type": "text", "text": text}
 
 
+def sniff_image_type(image_data: bytes) -> str:
+    """Detect the image format from its magic bytes, defaulting to png."""
+    if image_data[:4] == b"RIFF" and image_data[8:12] == b"WEBP":
+        return "webp"
+    for signature, image_type in IMAGE_SIGNATURES:
+        if image_data.startswith(signature):
+            return image_type
+    return "png"
+
+
+def image_data_url(image_data: bytes) -> str:
+    """Encode image bytes as a base64 data URL."""
+    encoded = base64.b64encode(image_data).decode("ascii")
+    return f"data:image/{sniff_image_type(image_data)};base64,{encoded}"
+
+
+def extract_json_object(s):
+    """Return the first balanced `{...}` span in a string, or None."""
+    start = s.find("{")
+    if start < 0:
+        return None
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(s)):
+        ch = s[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return s[start : i + 1]
+    return None
+
+
 def parse_json(s):
     try:
-        return json.loads(s)
-    except json.JSONDecodeError:
+        return orjson.loads(s)
+    except orjson.JSONDecodeError:
         return None
 
 
@@ -95,17 +144,7 @@ class OpenAIBaseProvider(LLMProvider):
         }
 
     def create_image_block(self, image_data: bytes):
-        image_type = "png"
-        try:
-            with Image.open(io.BytesIO(image_data)) as img:
-                image_type = img.format.lower()
-        except Exception:
-            pass
-        encoded = base64.b64encode(image_data).decode("utf-8")
-        return {
-            "type": "image_url",
-            "image_url": {"url": f"data:image/{image_type};base64,{encoded}"},
-        }
+        return {"type": "image_url", "image_url": {"url": image_data_url(image_data)}}
 
     def call(self, messages, functions=None):
         tools = self.create_function_schema(functions) if functions else None
@@ -114,18 +153,18 @@ class OpenAIBaseProvider(LLMProvider):
 
         if functions:
             tool_calls = message.tool_calls or []
-            combined_tool_calls = [
-                self.create_tool_call(
-                    tool_call.function.name, parse_json(tool_call.function.arguments)
-                )
-                for tool_call in tool_calls
-                if parse_json(tool_call.function.arguments) is not None
-            ]
+            combined_tool_calls = []
+            for tool_call in tool_calls:
+                parameters = parse_json(tool_call.function.arguments)
+                if parameters is not None:
+                    combined_tool_calls.append(
+                        self.create_tool_call(tool_call.function.name, parameters)
+                    )
 
             if message.content and not tool_calls:
-                tool_call_matches = re.search(r"\{.*\}", message.content)
-                if tool_call_matches:
-                    tool_call = parse_json(tool_call_matches.group(0))
+                tool_call_span = extract_json_object(message.content)
+                tool_call = parse_json(tool_call_span) if tool_call_span else None
+                if isinstance(tool_call, dict):
                     parameters = tool_call.get("parameters", tool_call.get("arguments"))
                     if tool_call.get("name") and parameters:
                         combined_tool_calls.append(
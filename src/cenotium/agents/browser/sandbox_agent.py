@@ -1,9 +1,12 @@
 """Sandbox agent for browser automation."""
 
+import io
 import json
 import logging
 import os
+import shlex
 import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, Optional
 
 from PIL import Image
@@ -15,6 +18,7 @@ logger = logging.getLogger(__name__)
 
 TYPING_DELAY_MS = 12
 TYPING_GROUP_SIZE = 50
+PASTE_THRESHOLD = 200
 
 TOOLS = {
     "stop": {
@@ -45,6 +49,7 @@ class SandboxAgent:
         grounding_model,
         output_dir: str = ".",
         additional_context: str = "",
+        paste_threshold: Optional[int] = PASTE_THRESHOLD,
     ):
         self.sandbox = sandbox
         self.vision_model = vision_model
@@ -52,9 +57,14 @@ class SandboxAgent:
         self.grounding_model = grounding_model
         self.messages = []
         self.latest_screenshot = None
+        self.latest_screenshot_bytes = None
         self.image_counter = 0
         self.tmp_dir = tempfile.mkdtemp()
+        self._tmp_prefix = self.tmp_dir + os.sep
+        self._saver = ThreadPoolExecutor(max_workers=1)
+        self._screenshot_saved: Optional[Future] = None
         self.additional_context = additional_context
+        self.paste_threshold = paste_threshold
 
     def call_function(self, name: str, arguments: Optional[Dict] = None):
         func_impl = getattr(self, name.lower(), None) if name.lower() in TOOLS else None
@@ -65,24 +75,53 @@ class SandboxAgent:
                 return f"Error: {e}"
         return "Function not implemented."
 
-    def save_image(self, image, prefix: str = "image") -> str:
+    def _next_image_path(self, prefix: str) -> str:
         self.image_counter += 1
-        filename = f"{prefix}_{self.image_counter}.png"
-        filepath = os.path.join(self.tmp_dir, filename)
+        return f"{self._tmp_prefix}{prefix}_{self.image_counter}.png"
+
+    @staticmethod
+    def _write_image(image, filepath: str):
         if isinstance(image, Image.Image):
-            image.save(filepath)
+            # Few-colour UI frames round-trip exactly through a 256-colour palette.
+            if image.mode == "RGB" and image.getcolors(256) is not None:
+                image = image.convert("P", palette=Image.Palette.ADAPTIVE, colors=256)
+            image.save(filepath, format="PNG", optimize=True)
         else:
             with open(filepath, "wb") as f:
                 f.write(image)
+
+    def save_image(self, image, prefix: str = "image") -> str:
+        filepath = self._next_image_path(prefix)
+        self._write_image(image, filepath)
         return filepath
 
+    def save_image_async(self, image, prefix: str = "image") -> Future:
+        """Write an image on the background saver thread."""
+        filepath = self._next_image_path(prefix)
+        return self._saver.submit(self._write_image, image, filepath)
+
     def take_screenshot(self) -> bytes:
-        file = self.sandbox.take_screenshot()
-        filename = self.save_image(file, "screenshot")
-        logger.debug(f"screenshot {filename}")
+        data = self.sandbox.take_screenshot()
+        if isinstance(data, Image.Image):
+            buffer = io.BytesIO()
+            data.save(buffer, format="PNG")
+            data = buffer.getvalue()
+        else:
+            # e2b hands back a bytearray; downstream caches need hashable bytes.
+            data = bytes(data)
+
+        filename = self._next_image_path("screenshot")
+        logger.debug("screenshot %s", filename)
         self.latest_screenshot = filename
-        with open(filename, "rb") as image_file:
-            return image_file.read()
+        self.latest_screenshot_bytes = data
+        self._screenshot_saved = self._saver.submit(self._write_image, data, filename)
+        return data
+
+    def latest_screenshot_path(self) -> str:
+        """Path of the latest screenshot, once it has been written to disk."""
+        if self._screenshot_saved is not None:
+            self._screenshot_saved.result()
+        return self.latest_screenshot
 
     @tool(
         description="Run a shell command and return the result.",
@@ -116,16 +155,30 @@ class SandboxAgent:
         params={"text": "Text to type"},
     )
     def type_text(self, text: str) -> str:
+        # Long text is pasted from the clipboard instead of typed key by key.
+        if self.paste_threshold is not None and len(text) > self.paste_threshold:
+            try:
+                # xclip forks to own the selection; detach it from our pipes.
+                self.sandbox.commands.run(
+                    f"printf %s {shlex.quote(text)} "
+                    "| xclip -selection clipboard >/dev/null 2>&1",
+                    timeout=5,
+                )
+            except Exception as e:
+                logger.debug("clipboard paste unavailable, typing instead: %s", e)
+            else:
+                self.sandbox.press("ctrl+v")
+                return "Text pasted."
         self.sandbox.write(
             text, chunk_size=TYPING_GROUP_SIZE, delay_in_ms=TYPING_DELAY_MS
         )
         return "Text typed."
 
     def click_element(self, query: str, click_command, action_name: str = "click"):
-        self.take_screenshot()
-        position = self.grounding_model.call(query, self.latest_screenshot)
-        dot_image = draw_big_dot(Image.open(self.latest_screenshot), position)
-        self.save_image(dot_image, "location")
+        screenshot = self.take_screenshot()
+        position = self.grounding_model.call(query, self.latest_screenshot_path())
+        dot_image = draw_big_dot(Image.open(io.BytesIO(screenshot)), position)
+        self.save_image_async(dot_image, "location")
 
         x, y = position
         self.sandbox.move_mouse(x, y)
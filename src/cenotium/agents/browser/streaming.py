@@ -12,30 +12,81 @@ class DisplayClient:
 
     def __init__(self, output_dir: str = "."):
         self.process = None
+        self.player = None
         self.output_stream = f"{output_dir}/output.ts"
         self.output_file = f"{output_dir}/output.mp4"
 
     async def start(self, stream_url: str, title: str = "Sandbox", delay: int = 0):
-        title = title.replace("'", "\\'")
-        self.process = await asyncio.create_subprocess_shell(
-            f"sleep {delay} && ffmpeg -reconnect 1 -i {stream_url} -c:v libx264 -preset fast -crf 23 "
-            f"-c:a aac -b:a 128k -f mpegts -loglevel quiet - | tee {self.output_stream} | "
-            f"ffplay -autoexit -i -loglevel quiet -window_title '{title}' -",
-            preexec_fn=os.setsid,
-            stdin=asyncio.subprocess.DEVNULL,
-        )
+        if delay:
+            await asyncio.sleep(delay)
+
+        # ffmpeg's tee muxer writes the recording and feeds ffplay over a pipe.
+        read_fd, write_fd = os.pipe()
+        try:
+            self.process = await asyncio.create_subprocess_exec(
+                "ffmpeg",
+                "-reconnect",
+                "1",
+                "-i",
+                stream_url,
+                "-c:v",
+                "libx264",
+                "-preset",
+                "fast",
+                "-crf",
+                "23",
+                "-c:a",
+                "aac",
+                "-b:a",
+                "128k",
+                "-map",
+                "0",
+                "-f",
+                "tee",
+                "-loglevel",
+                "quiet",
+                f"[f=mpegts]{self.output_stream}|[f=mpegts]pipe:1",
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=write_fd,
+                start_new_session=True,
+            )
+            self.player = await asyncio.create_subprocess_exec(
+                "ffplay",
+                "-autoexit",
+                "-loglevel",
+                "quiet",
+                "-window_title",
+                title,
+                "-i",
+                "-",
+                stdin=read_fd,
+                start_new_session=True,
+            )
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
 
     async def stop(self):
-        if self.process:
-            try:
-                os.killpg(os.getpgid(self.process.pid), signal.SIGTERM)
-            except ProcessLookupError:
-                pass
-            await self.process.wait()
+        for process in (self.player, self.process):
+            if process:
+                try:
+                    os.killpg(os.getpgid(process.pid), signal.SIGTERM)
+                except ProcessLookupError:
+                    pass
+                await process.wait()
 
     async def save_stream(self):
-        process = await asyncio.create_subprocess_shell(
-            f"ffmpeg -i {self.output_stream} -c:v copy -c:a copy -loglevel quiet {self.output_file}"
+        process = await asyncio.create_subprocess_exec(
+            "ffmpeg",
+            "-i",
+            self.output_stream,
+            "-c:v",
+            "copy",
+            "-c:a",
+            "copy",
+            "-loglevel",
+            "quiet",
+            self.output_file,
         )
         await process.wait()
         if process.returncode == 0:
@@ -58,6 +109,9 @@ class Browser:
                 [sys.executable, script_path, stream_url, title, str(self.port)],
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
+                bufsize=-1,
+                close_fds=True,
+                start_new_session=True,
             )
         except Exception as e:
             print(f"Failed to start browser: {e}")
@@ -65,7 +119,9 @@ class Browser:
     def stop(self):
         if self.process:
             try:
-                self.process.terminate()
+                os.killpg(self.process.pid, signal.SIGTERM)
+                self.process = None
+            except ProcessLookupError:
                 self.process = None
             except Exception as e:
                 print(f"Failed to stop browser: {e}")
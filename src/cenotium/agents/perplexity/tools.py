@@ -1,33 +1,80 @@
 """Perplexity search tool for web queries."""
 
+import asyncio
 import os
+import weakref
+from typing import Optional, Tuple
 
+import httpx
+import orjson
 import requests
 from langchain.tools import Tool
 
+API_URL = "https://api.perplexity.ai/chat/completions"
+REQUEST_TIMEOUT = 30
 
-def perplexity_search(query: str) -> str:
-    """Search the internet using Perplexity API."""
-    api_url = "https://api.perplexity.ai/chat/completions"
-    api_key = os.getenv("PERPLEXITY_KEY")
+_session = requests.Session()
+# One pooled AsyncClient per event loop.
+_async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
+
+def _build_request(query: str) -> Optional[Tuple[dict, bytes]]:
+    api_key = os.getenv("PERPLEXITY_KEY")
     if not api_key:
-        return "Error: PERPLEXITY_KEY environment variable not set"
+        return None
 
     headers = {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
     }
-
     payload = {
         "model": "sonar-pro",
         "messages": [{"role": "user", "content": query}],
     }
+    return headers, orjson.dumps(payload)
+
+
+def _async_client() -> httpx.AsyncClient:
+    """Pooled client for the running event loop (httpx clients are loop-bound)."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            timeout=REQUEST_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+        _async_clients[loop] = client
+    return client
+
+
+def perplexity_search(query: str) -> str:
+    """Search the internet using Perplexity API."""
+    request = _build_request(query)
+    if request is None:
+        return "Error: PERPLEXITY_KEY environment variable not set"
+    headers, payload = request
+
+    response = _session.post(
+        API_URL, headers=headers, data=payload, timeout=REQUEST_TIMEOUT
+    )
+
+    if response.status_code == 200:
+        result = orjson.loads(response.content)
+        return result["choices"][0]["message"]["content"]
+    return f"Error: {response.status_code} - {response.text}"
+
+
+async def perplexity_search_async(query: str) -> str:
+    """Search the internet using Perplexity API without blocking the event loop."""
+    request = _build_request(query)
+    if request is None:
+        return "Error: PERPLEXITY_KEY environment variable not set"
+    headers, payload = request
 
-    response = requests.post(api_url, headers=headers, json=payload, timeout=30)
+    response = await _async_client().post(API_URL, headers=headers, content=payload)
 
     if response.status_code == 200:
-        result = response.json()
+        result = orjson.loads(response.content)
         return result["choices"][0]["message"]["content"]
     return f"Error: {response.status_code} - {response.text}"
 
@@ -35,5 +82,6 @@ def perplexity_search(query: str) -> str:
 perplexity_tool = Tool(
     name="PerplexitySearch",
     func=perplexity_search,
+    coroutine=perplexity_search_async,
     description="Search the internet via the Perplexity API. Input: search query string.",
 )
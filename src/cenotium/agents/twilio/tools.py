@@ -1,11 +1,19 @@
 """Twilio calling tool for phone automation."""
 
+import asyncio
+import functools
 import os
+import weakref
+from typing import Optional, Tuple
 
 from langchain.tools import StructuredTool
 from pydantic import BaseModel, Field
+from twilio.http.async_http_client import AsyncTwilioHttpClient
 from twilio.rest import Client
 
+# Async clients per event loop, keyed by credentials.
+_async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
 
 class TwilioCallParams(BaseModel):
     """Parameters for Twilio call."""
@@ -14,27 +22,62 @@ class TwilioCallParams(BaseModel):
     message: str = Field(..., description="Message to speak on the call")
 
 
-def make_twilio_call(to_number: str, message: str) -> str:
-    """Place a call using Twilio."""
+def _credentials() -> Optional[Tuple[str, str]]:
     account_sid = os.getenv("ACCOUNT_SID")
     auth_token = os.getenv("TWILIO_KEY")
-
     if not account_sid or not auth_token:
+        return None
+    return account_sid, auth_token
+
+
+@functools.lru_cache(maxsize=4)
+def _client(account_sid: str, auth_token: str) -> Client:
+    return Client(account_sid, auth_token)
+
+
+def _async_client(account_sid: str, auth_token: str) -> Client:
+    """Client for the running event loop (aiohttp sessions are loop-bound)."""
+    clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get((account_sid, auth_token))
+    if client is None:
+        client = Client(account_sid, auth_token, http_client=AsyncTwilioHttpClient())
+        clients[(account_sid, auth_token)] = client
+    return client
+
+
+def _call_params(to_number: str, message: str) -> dict:
+    return {
+        "twiml": f"<Response><Say>{message}</Say></Response>",
+        "to": to_number,
+        "from_": os.getenv("TWILIO_FROM_NUMBER", "+18778515935"),
+    }
+
+
+def make_twilio_call(to_number: str, message: str) -> str:
+    """Place a call using Twilio."""
+    credentials = _credentials()
+    if credentials is None:
         return "Error: ACCOUNT_SID or TWILIO_KEY not set"
 
-    client = Client(account_sid, auth_token)
-    from_number = os.getenv("TWILIO_FROM_NUMBER", "+18778515935")
+    call = _client(*credentials).calls.create(**_call_params(to_number, message))
+    return f"Call placed to {to_number} with SID: {call.sid}"
+
+
+async def make_twilio_call_async(to_number: str, message: str) -> str:
+    """Place a call using Twilio without blocking the event loop."""
+    credentials = _credentials()
+    if credentials is None:
+        return "Error: ACCOUNT_SID or TWILIO_KEY not set"
 
-    call = client.calls.create(
-        twiml=f"<Response><Say>{message}</Say></Response>",
-        to=to_number,
-        from_=from_number,
+    call = await _async_client(*credentials).calls.create_async(
+        **_call_params(to_number, message)
     )
     return f"Call placed to {to_number} with SID: {call.sid}"
 
 
 twilio_tool = StructuredTool.from_function(
     func=make_twilio_call,
+    coroutine=make_twilio_call_async,
     name="make_twilio_call",
     description="Place a call using Twilio. Provide phone number in E.164 format and message.",
     args_schema=TwilioCallParams,
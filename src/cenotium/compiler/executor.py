@@ -1,19 +1,70 @@
 """Executor for LLMCompiler tasks."""
 
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, List, Optional
+import asyncio
+import contextvars
+import functools
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import BaseTool
 
+from .output_parser import Task
+from .task_fetching import UNRESOLVED_DEPENDENCY_ERROR, _execute_task, _make_replacer
+
+# Scratch space for the tool call running in the current thread or task.
+_task_memory: contextvars.ContextVar[Dict[str, Any]] = contextvars.ContextVar(
+    "_task_memory"
+)
+
+
+def _dedupe_calls(
+    tasks: List[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], List[int]]:
+    """Collapse identical (tool, args) calls; return unique tasks and positions."""
+    unique: List[Dict[str, Any]] = []
+    seen: Dict[Tuple[str, str], int] = {}
+    positions = []
+    for task in tasks:
+        tool = task["tool"]
+        key = (
+            getattr(tool, "name", tool),
+            json.dumps(task["args"], sort_keys=True, default=str),
+        )
+        if key not in seen:
+            seen[key] = len(unique)
+            unique.append(task)
+        positions.append(seen[key])
+    return unique, positions
+
+
+def _resolvable(tasks: Dict[int, Task], observed: Set[int]) -> Set[int]:
+    """Indices of tasks whose dependencies can all be met by `observed` or the batch.
+
+    Unknown or self dependencies, cycles and anything downstream of them are left
+    out, matching the tasks schedule_tasks reports as never run.
+    """
+    resolved: Set[int] = set()
+    pending = dict(tasks)
+    progress = True
+    while progress:
+        progress = False
+        for idx, task in list(pending.items()):
+            if all(d in observed or d in resolved for d in task["dependencies"]):
+                resolved.add(idx)
+                del pending[idx]
+                progress = True
+    return resolved
+
 
 class FunctionExecutor:
     """Executes functions with isolated memory spaces."""
 
-    def __init__(self, max_workers: Optional[int] = None):
-        self.max_workers = max_workers
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
-        self.memory = {}
+    @staticmethod
+    def memory() -> Dict[str, Any]:
+        """Memory of the call currently executing in this context."""
+        return _task_memory.get()
 
     def execute(
         self,
@@ -22,50 +73,115 @@ class FunctionExecutor:
         call_id: str,
         config: Optional[RunnableConfig] = None,
     ) -> Any:
+        token = _task_memory.set({"call_id": call_id})
         try:
-            self.memory[call_id] = {}
-            result = tool.invoke(args, config)
-            del self.memory[call_id]
-            return result
-        except Exception:
-            self.memory.pop(call_id, None)
-            raise
+            return tool.invoke(args, config)
+        finally:
+            _task_memory.reset(token)
 
 
 class ExecutorPool:
-    """Pool of function executors for parallel task execution."""
-
-    def __init__(self, num_executors: int = 4):
-        self.executors = [FunctionExecutor() for _ in range(num_executors)]
-        self.current = 0
+    """Shared thread pool for parallel task execution."""
 
-    def get_executor(self) -> FunctionExecutor:
-        executor = self.executors[self.current]
-        self.current = (self.current + 1) % len(self.executors)
-        return executor
+    def __init__(self, max_workers: int = 32):
+        self.executor = FunctionExecutor()
+        self.thread_pool = ThreadPoolExecutor(max_workers=max_workers)
 
     def execute_batch(
         self, tasks: List[Dict[str, Any]], config: Optional[RunnableConfig] = None
     ) -> List[Any]:
-        results = []
-        futures = []
-
-        with ThreadPoolExecutor() as thread_pool:
-            for task in tasks:
-                executor = self.get_executor()
-                future = thread_pool.submit(
-                    executor.execute,
-                    tool=task["tool"],
-                    args=task["args"],
-                    call_id=str(task["idx"]),
-                    config=config,
-                )
-                futures.append(future)
+        unique, positions = _dedupe_calls(tasks)
+        futures = {
+            self.thread_pool.submit(
+                self.executor.execute,
+                tool=task["tool"],
+                args=task["args"],
+                call_id=str(task["idx"]),
+                config=config,
+            ): i
+            for i, task in enumerate(unique)
+        }
 
-        for future in futures:
+        results: List[Any] = [None] * len(unique)
+        for future in as_completed(futures):
             try:
-                results.append(future.result())
+                results[futures[future]] = future.result()
             except Exception as e:
-                results.append(f"ERROR: {e}")
+                results[futures[future]] = f"ERROR: {e}"
+
+        return [results[position] for position in positions]
+
+    async def aexecute_batch(
+        self, tasks: List[Dict[str, Any]], config: Optional[RunnableConfig] = None
+    ) -> List[Any]:
+        unique, positions = _dedupe_calls(tasks)
+        loop = asyncio.get_running_loop()
+        outcomes = await asyncio.gather(
+            *[
+                loop.run_in_executor(
+                    self.thread_pool,
+                    functools.partial(
+                        self.executor.execute,
+                        tool=task["tool"],
+                        args=task["args"],
+                        call_id=str(task["idx"]),
+                        config=config,
+                    ),
+                )
+                for task in unique
+            ],
+            return_exceptions=True,
+        )
+        results = [
+            f"ERROR: {outcome}" if isinstance(outcome, Exception) else outcome
+            for outcome in outcomes
+        ]
+        return [results[position] for position in positions]
+
+    async def aschedule(
+        self,
+        tasks: Iterable[Task],
+        config: Optional[RunnableConfig] = None,
+        observations: Optional[Dict[int, Any]] = None,
+        max_concurrency: int = 8,
+    ) -> Dict[int, Any]:
+        """Run a task DAG, starting each task as soon as its dependencies finish.
+
+        Async counterpart of schedule_tasks for callers already on an event loop;
+        LLMCompiler's graph does not use it yet. Tasks whose dependencies cannot
+        be met get the same error observation schedule_tasks records.
+        """
+        tasks = list(tasks)
+        observations = dict(observations or {})
+        observed = set(observations)
+        by_idx = {task["idx"]: task for task in tasks}
+        runnable = _resolvable(by_idx, observed)
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        finished = {idx: loop.create_future() for idx in runnable}
+        replacer = _make_replacer(observations)
+
+        async def run(task: Task):
+            await asyncio.gather(
+                *[finished[d] for d in task["dependencies"] if d not in observed]
+            )
+            async with semaphore:
+                try:
+                    observation = await loop.run_in_executor(
+                        self.thread_pool,
+                        _execute_task,
+                        task,
+                        observations,
+                        config,
+                        replacer,
+                    )
+                except Exception as e:
+                    observation = f"ERROR: Task execution failed. {repr(e)}"
+            observations[task["idx"]] = observation
+            finished[task["idx"]].set_result(None)
 
-        return results
+        for idx in by_idx:
+            if idx not in runnable:
+                observations[idx] = UNRESOLVED_DEPENDENCY_ERROR
+        await asyncio.gather(*[run(by_idx[idx]) for idx in runnable])
+        return observations
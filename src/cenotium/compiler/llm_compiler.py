@@ -1,11 +1,14 @@
 """Main LLMCompiler implementation for task planning and execution."""
 
 import asyncio
-import itertools
+import functools
+import os
 from typing import Any, Dict, List, Optional
 
+import orjson
 from dotenv import load_dotenv
 from langchain import hub
+from langchain_core.load import dumpd, load
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnableConfig, RunnableLambda
@@ -22,6 +25,30 @@ from .task_fetching import schedule_tasks
 
 load_dotenv()
 
+PLANNER_PROMPT_NAME = "wfh/llm-compiler"
+PROMPT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "cenotium", "prompts.json"
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_planner_prompt() -> ChatPromptTemplate:
+    """Load the planner prompt from the disk cache, pulling from the hub once."""
+    try:
+        with open(PROMPT_CACHE_PATH, "rb") as f:
+            return load(orjson.loads(f.read())[PLANNER_PROMPT_NAME])
+    except (OSError, KeyError, ValueError):
+        pass
+
+    prompt = hub.pull(PLANNER_PROMPT_NAME)
+    try:
+        os.makedirs(os.path.dirname(PROMPT_CACHE_PATH), exist_ok=True)
+        with open(PROMPT_CACHE_PATH, "wb") as f:
+            f.write(orjson.dumps({PLANNER_PROMPT_NAME: dumpd(prompt)}))
+    except OSError:
+        pass
+    return prompt
+
 
 class State(TypedDict):
     messages: Annotated[List[BaseMessage], add_messages]
@@ -84,10 +111,11 @@ class LLMCompiler:
         self.tools = tools or [_create_trip_planner_tool()]
         self.llm = ChatOpenAI(model=model, temperature=0)
         self.executor_pool = ExecutorPool()
+        self._graph = None
         self._setup_components()
 
     def _setup_components(self):
-        self.planner_prompt = hub.pull("wfh/llm-compiler")
+        self.planner_prompt = _get_planner_prompt()
         self.joiner_prompt = ChatPromptTemplate.from_messages(
             [
                 (
@@ -142,15 +170,9 @@ Analyze the plan and provide:
 
     def plan_and_schedule(self, state: Dict[str, Any]) -> Dict[str, Any]:
         messages = state["messages"]
-        tasks_iter = self.parser.stream(messages)
-        try:
-            first_task = next(tasks_iter)
-            tasks_iter = itertools.chain([first_task], tasks_iter)
-        except StopIteration:
-            tasks_iter = iter([])
         return {
             "messages": schedule_tasks(
-                {"messages": messages, "tasks": tasks_iter},
+                {"messages": messages, "tasks": self.parser.stream(messages)},
                 config=RunnableConfig(recursion_limit=100),
             )
         }
@@ -177,31 +199,33 @@ Analyze the plan and provide:
         graph.add_edge(START, "plan_and_schedule")
         return graph.compile()
 
+    def _get_graph(self):
+        if self._graph is None:
+            self._graph = self.create_graph()
+        return self._graph
+
     async def astream(
         self, query: str, config: Optional[Dict] = None, timeout: int = 120
     ):
         config = config or {"recursion_limit": 100}
-        chain = self.create_graph()
-
-        async def async_gen_wrapper():
-            for item in chain.stream(
-                {"messages": [HumanMessage(content=query)]}, config
-            ):
-                yield item
-
-        agen = async_gen_wrapper()
-        while True:
-            try:
-                step = await asyncio.wait_for(agen.__anext__(), timeout=timeout)
+        chain = self._get_graph()
+
+        agen = chain.astream({"messages": [HumanMessage(content=query)]}, config)
+        try:
+            while True:
+                try:
+                    step = await asyncio.wait_for(anext(agen), timeout=timeout)
+                except StopAsyncIteration:
+                    break
+                except asyncio.TimeoutError:
+                    yield {"error": "Timeout reached"}
+                    break
                 yield step
-            except StopAsyncIteration:
-                break
-            except asyncio.TimeoutError:
-                yield {"error": "Timeout reached"}
-                break
+        finally:
+            await agen.aclose()
 
     def run(self, query: str) -> str:
-        chain = self.create_graph()
+        chain = self._get_graph()
         result = chain.invoke(
             {"messages": [HumanMessage(content=query)]},
             {"recursion_limit": 100},
@@ -1,20 +1,39 @@
 """Output parser for LLMCompiler."""
 
 import ast
+import functools
 import re
-from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from langchain_core.exceptions import OutputParserException
 from langchain_core.messages import BaseMessage
 from langchain_core.output_parsers.transform import BaseTransformOutputParser
 from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import BaseTool
+from pydantic import PrivateAttr
 from typing_extensions import TypedDict
 
 THOUGHT_PATTERN = r"Thought: ([^\n]*)"
 ACTION_PATTERN = r"\n*(\d+)\. (\w+)\((.*)\)(\s*#\w+\n)?"
 ID_PATTERN = r"\$\{?(\d+)\}?"
 
+# THOUGHT_PATTERN | ACTION_PATTERN as one alternation, so each line is matched once.
+_LINE_RE = re.compile(
+    r"Thought: (?P<thought>[^\n]*)"
+    r"|\n*(?P<idx>\d+)\. (?P<tool>\w+)\((?P<args>.*)\)(?:\s*#\w+\n)?"
+)
+_ID_RE = re.compile(ID_PATTERN)
+
 
 def _ast_parse(arg: str) -> Any:
     try:
@@ -23,61 +42,70 @@ def _ast_parse(arg: str) -> Any:
         return arg
 
 
+@functools.lru_cache(maxsize=128)
+def _arg_key_re(keys: Tuple[str, ...]) -> "re.Pattern[str]":
+    return re.compile(r"(?<!\w)(" + "|".join(map(re.escape, keys)) + r")=")
+
+
 def _parse_llm_compiler_action_args(args: str, tool: Union[str, BaseTool]) -> dict:
-    if args == "":
+    if args == "" or not isinstance(tool, BaseTool):
+        return {}
+
+    keys = tuple(tool.args.keys())
+    if not keys:
         return {}
 
+    spans = []
+    seen = set()
+    for match in _arg_key_re(keys).finditer(args):
+        key = match.group(1)
+        if key not in seen:
+            seen.add(key)
+            spans.append((key, match.start(), match.end()))
+
     extracted_args = {}
-    tool_key = None
-    prev_idx = None
-
-    if isinstance(tool, BaseTool):
-        for key in tool.args.keys():
-            if f"{key}=" in args:
-                idx = args.index(f"{key}=")
-                if prev_idx is not None:
-                    extracted_args[tool_key] = _ast_parse(
-                        args[prev_idx:idx].strip().rstrip(",")
-                    )
-                args = args.split(f"{key}=", 1)[1]
-                tool_key = key
-                prev_idx = 0
-
-        if prev_idx is not None:
-            extracted_args[tool_key] = _ast_parse(
-                args[prev_idx:].strip().rstrip(",").rstrip(")")
-            )
+    last = len(spans) - 1
+    for i, (key, _, value_start) in enumerate(spans):
+        if i < last:
+            value = args[value_start : spans[i + 1][1]].strip().rstrip(",")
+        else:
+            value = args[value_start:].strip().rstrip(",").rstrip(")")
+        extracted_args[key] = _ast_parse(value)
 
     return extracted_args
 
 
 def _get_dependencies_from_graph(
     idx: int, tool_name: str, args: Dict[str, Any]
-) -> List[int]:
+) -> Sequence[int]:
     if tool_name == "join":
-        return list(range(1, idx))
+        return range(1, idx)
 
-    def extract_deps(arg_str: str) -> List[int]:
-        matches = re.findall(ID_PATTERN, str(arg_str))
-        return [int(match) for match in matches]
+    if not args:
+        return []
 
     deps = []
     for arg_value in args.values():
-        deps.extend(extract_deps(str(arg_value)))
+        if isinstance(arg_value, (int, float)):
+            continue
+        if not isinstance(arg_value, str):
+            arg_value = str(arg_value)
+        if "$" in arg_value:
+            deps.extend(int(match) for match in _ID_RE.findall(arg_value))
 
-    return sorted(list(set(deps)))
+    return list(dict.fromkeys(deps))
 
 
 class Task(TypedDict):
     idx: int
     tool: Union[BaseTool, str]
     args: Dict[str, Any]
-    dependencies: List[int]
+    dependencies: Sequence[int]
     thought: Optional[str]
 
 
 def instantiate_task(
-    tools: List[BaseTool],
+    tools: Mapping[str, BaseTool],
     idx: int,
     tool_name: str,
     args: str,
@@ -87,8 +115,8 @@ def instantiate_task(
         tool = "join"
     else:
         try:
-            tool = tools[[t.name for t in tools].index(tool_name)]
-        except ValueError as e:
+            tool = tools[tool_name]
+        except KeyError as e:
             raise OutputParserException(f"Tool {tool_name} not found.") from e
 
     tool_args = _parse_llm_compiler_action_args(args, tool)
@@ -106,6 +134,13 @@ def instantiate_task(
 class LLMCompilerPlanParser(BaseTransformOutputParser[Dict]):
     tools: List[BaseTool]
 
+    _tool_by_name: Optional[Dict[str, BaseTool]] = PrivateAttr(default=None)
+
+    def _tools_by_name(self) -> Dict[str, BaseTool]:
+        if self._tool_by_name is None:
+            self._tool_by_name = {tool.name: tool for tool in self.tools}
+        return self._tool_by_name
+
     def _transform(
         self, input: Union[str, BaseMessage, List[Union[str, BaseMessage]]]
     ) -> Iterator[Task]:
@@ -149,35 +184,40 @@ class LLMCompilerPlanParser(BaseTransformOutputParser[Dict]):
     def ingest_token(
         self, token: str, buffer: List[str], thought: Optional[str]
     ) -> Iterator[Tuple[Optional[Task], str]]:
-        buffer.append(token)
-
-        if "\n" in token:
-            buffer_ = "".join(buffer).split("\n")
-            suffix = buffer_[-1]
-
-            for line in buffer_[:-1]:
-                task, thought = self._parse_task(line, thought)
-                if task:
-                    yield task, thought
-
-            buffer.clear()
-            buffer.append(suffix)
+        newline = token.rfind("\n")
+        if newline == -1:
+            buffer.append(token)
+            return
+
+        # Only the pending partial line plus this token's complete lines are joined.
+        buffer.append(token[:newline])
+        lines = "".join(buffer).split("\n")
+        buffer.clear()
+        if newline + 1 < len(token):
+            buffer.append(token[newline + 1 :])
+
+        for line in lines:
+            task, thought = self._parse_task(line, thought)
+            if task:
+                yield task, thought
 
     def _parse_task(
         self, line: str, thought: Optional[str] = None
     ) -> Tuple[Optional[Task], Optional[str]]:
         task = None
 
-        if match := re.match(THOUGHT_PATTERN, line):
-            thought = match.group(1)
-        elif match := re.match(ACTION_PATTERN, line):
-            idx, tool_name, args, _ = match.groups()
-            idx = int(idx)
+        match = _LINE_RE.match(line)
+        if match is None:
+            return task, thought
+
+        if match.group("idx") is None:
+            thought = match.group("thought")
+        else:
             task = instantiate_task(
-                tools=self.tools,
-                idx=idx,
-                tool_name=tool_name,
-                args=args,
+                tools=self._tools_by_name(),
+                idx=int(match.group("idx")),
+                tool_name=match.group("tool"),
+                args=match.group("args"),
                 thought=thought,
             )
             thought = None
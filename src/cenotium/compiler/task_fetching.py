@@ -1,9 +1,11 @@
 """Task Fetching Unit for LLMCompiler."""
 
+import os
+import queue
 import re
-import time
-from concurrent.futures import ThreadPoolExecutor, wait
-from typing import Any, Dict, Iterable, List, Optional, Union
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
 from langchain_core.messages import BaseMessage, FunctionMessage
 from langchain_core.runnables import RunnableConfig
@@ -12,6 +14,15 @@ from typing_extensions import TypedDict
 from .output_parser import Task
 
 ID_PATTERN = r"\$\{?(\d+)\}?"
+ID_RE = re.compile(ID_PATTERN)
+
+_WORKERS = int(os.getenv("CENOTIUM_TASK_WORKERS", "8"))
+
+Replacer = Callable[[re.Match], str]
+
+UNRESOLVED_DEPENDENCY_ERROR = (
+    "ERROR: Task was never run because its dependencies did not complete."
+)
 
 
 class SchedulerInput(TypedDict):
@@ -20,30 +31,46 @@ class SchedulerInput(TypedDict):
 
 
 def _get_observations(messages: List[BaseMessage]) -> Dict[int, Any]:
+    # Walk newest-first and keep the first (most recent) observation per idx.
     results = {}
+    function_message = FunctionMessage
     for message in reversed(messages):
-        if isinstance(message, FunctionMessage):
-            idx_val = message.additional_kwargs.get("idx")
-            if idx_val is not None:
-                results[int(idx_val)] = message.content
+        if not isinstance(message, function_message):
+            continue
+        idx_val = message.additional_kwargs.get("idx")
+        if idx_val is None:
+            continue
+        idx = int(idx_val)
+        if idx not in results:
+            results[idx] = message.content
     return results
 
 
-def _resolve_arg(arg: Union[str, Any], observations: Dict[int, Any]) -> Any:
-    if isinstance(arg, str):
+def _make_replacer(observations: Dict[int, Any]) -> Replacer:
+    """Substitution callback for ID_RE that reads from a live observations dict."""
 
-        def replace_match(match):
-            idx = int(match.group(1))
-            return str(observations.get(idx, match.group(0)))
+    def replace_match(match: re.Match) -> str:
+        idx = int(match.group(1))
+        return str(observations.get(idx, match.group(0)))
 
-        return re.sub(ID_PATTERN, replace_match, arg)
+    return replace_match
+
+
+def _resolve_arg(arg: Union[str, Any], replacer: Replacer) -> Any:
+    if isinstance(arg, str):
+        if "$" not in arg:
+            return arg
+        return ID_RE.sub(replacer, arg)
     elif isinstance(arg, list):
-        return [_resolve_arg(a, observations) for a in arg]
+        return [_resolve_arg(a, replacer) for a in arg]
     return arg
 
 
 def _execute_task(
-    task: Task, observations: Dict, config: Optional[RunnableConfig] = None
+    task: Task,
+    observations: Dict,
+    config: Optional[RunnableConfig] = None,
+    replacer: Optional[Replacer] = None,
 ) -> Any:
     tool_to_use = task["tool"]
     if isinstance(tool_to_use, str):
@@ -52,8 +79,9 @@ def _execute_task(
     args = task["args"]
     try:
         if isinstance(args, dict):
+            replacer = replacer or _make_replacer(observations)
             resolved_args = {
-                key: _resolve_arg(val, observations) for key, val in args.items()
+                key: _resolve_arg(val, replacer) for key, val in args.items()
             }
         else:
             resolved_args = args
@@ -71,27 +99,14 @@ def schedule_task(task_inputs: Dict) -> None:
     observations: Dict[int, Any] = task_inputs["observations"]
     config = task_inputs.get("config")
     try:
-        observation = _execute_task(task, observations, config)
+        observation = _execute_task(
+            task, observations, config, task_inputs.get("replacer")
+        )
         observations[task["idx"]] = observation
     except Exception as e:
         observations[task["idx"]] = f"ERROR: Task execution failed. {repr(e)}"
 
 
-def schedule_pending_task(
-    task: Task,
-    observations: Dict[int, Any],
-    retry_after: float = 0.2,
-    config: Optional[RunnableConfig] = None,
-) -> None:
-    while True:
-        deps = task["dependencies"]
-        if deps and any(dep not in observations for dep in deps):
-            time.sleep(retry_after)
-            continue
-        schedule_task({"task": task, "observations": observations, "config": config})
-        break
-
-
 def schedule_tasks(
     scheduler_input: SchedulerInput, config: Optional[RunnableConfig] = None
 ) -> List[FunctionMessage]:
@@ -100,38 +115,94 @@ def schedule_tasks(
     observations = _get_observations(messages)
     task_names = {}
     originals = set(observations)
-    futures = []
+    replacer = _make_replacer(observations)
+
+    # Waiting tasks keep a count of unmet dependencies; each completion decrements
+    # its dependents' counts and submits those that reach zero.
+    waiting: Dict[int, Task] = {}
+    remaining: Dict[int, int] = {}
+    dependents: Dict[int, List[int]] = defaultdict(list)
+    outstanding = 0
+    condition = threading.Condition()
+
+    # Ready tasks are fed to a fixed set of worker threads through one queue.
+    ready: "queue.SimpleQueue[Optional[Task]]" = queue.SimpleQueue()
+
+    def submit(task: Task) -> None:
+        nonlocal outstanding
+        outstanding += 1
+        ready.put(task)
+
+    def run(task: Task) -> None:
+        nonlocal outstanding
+        schedule_task(
+            {
+                "task": task,
+                "observations": observations,
+                "config": config,
+                "replacer": replacer,
+            }
+        )
+        with condition:
+            try:
+                for idx in dependents.pop(task["idx"], ()):
+                    remaining[idx] -= 1
+                    if remaining[idx] == 0:
+                        del remaining[idx]
+                        submit(waiting.pop(idx))
+            finally:
+                outstanding -= 1
+                condition.notify_all()
+
+    def work() -> None:
+        while (task := ready.get()) is not None:
+            run(task)
+
+    workers = [threading.Thread(target=work, daemon=True) for _ in range(_WORKERS)]
+    for worker in workers:
+        worker.start()
 
-    retry_after = 0.25
-    with ThreadPoolExecutor() as executor:
+    try:
         for task in tasks_iter:
-            deps = task["dependencies"]
-            task_names[task["idx"]] = (
+            idx = task["idx"]
+            task_names[idx] = (
                 task["tool"] if isinstance(task["tool"], str) else task["tool"].name
             )
-
-            if deps and any(dep not in observations for dep in deps):
-                futures.append(
-                    executor.submit(
-                        schedule_pending_task, task, observations, retry_after, config
-                    )
-                )
-            else:
-                schedule_task(
-                    {"task": task, "observations": observations, "config": config}
-                )
-
-        wait(futures)
-
-    tool_messages = []
-    for idx in sorted(observations.keys() - originals):
-        tool_messages.append(
-            FunctionMessage(
-                name=task_names[idx],
-                content=str(observations[idx]),
-                additional_kwargs={"idx": idx},
-                tool_call_id=str(idx),
-            )
+            with condition:
+                stale = waiting.pop(idx, None)
+                if stale is not None:
+                    # A repeated idx replaces its earlier, still-waiting registration.
+                    del remaining[idx]
+                    for dep in set(stale["dependencies"]):
+                        if idx in dependents.get(dep, ()):
+                            dependents[dep].remove(idx)
+                missing = {d for d in task["dependencies"] if d not in observations}
+                if not missing:
+                    submit(task)
+                    continue
+                waiting[idx] = task
+                remaining[idx] = len(missing)
+                for dep in missing:
+                    dependents[dep].append(idx)
+
+        with condition:
+            condition.wait_for(lambda: outstanding == 0)
+            for idx in waiting:
+                observations[idx] = UNRESOLVED_DEPENDENCY_ERROR
+    finally:
+        for _ in workers:
+            ready.put(None)
+        for worker in workers:
+            worker.join()
+
+    # task_names is filled in submission order, so no sort is needed.
+    return [
+        FunctionMessage(
+            name=name,
+            content=str(observations[idx]),
+            additional_kwargs={"idx": idx},
+            tool_call_id=str(idx),
         )
-
-    return tool_messages
+        for idx, name in task_names.items()
+        if idx not in originals
+    ]
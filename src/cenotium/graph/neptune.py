@@ -1,31 +1,68 @@
 """AWS Neptune graph database integration."""
 
 import logging
+from typing import Any, Dict, List
 
-from flask import Flask, jsonify, request
+import orjson
+from flask import Flask, Response, request
 from flask_cors import CORS
 from gremlin_python.driver import client, serializer
+from gremlin_python.driver.driver_remote_connection import DriverRemoteConnection
+from gremlin_python.process.anonymous_traversal import traversal
+from gremlin_python.process.traversal import TextP
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def json_response(payload: Any, status: int = 200) -> Response:
+    """Serialize a payload to a JSON response with orjson."""
+    return Response(
+        orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS),
+        status=status,
+        mimetype="application/json",
+    )
+
+
 class NeptuneClient:
     """Client for AWS Neptune graph database."""
 
-    def __init__(self, endpoint: str, port: str = "8182"):
+    def __init__(
+        self,
+        endpoint: str,
+        port: str = "8182",
+        pool_size: int = 16,
+        max_workers: int = 8,
+    ):
         url = f"wss://{endpoint}:{port}/gremlin"
         self.client = client.Client(
-            url, "g", message_serializer=serializer.GraphSONSerializersV2d0()
+            url,
+            "g",
+            message_serializer=serializer.GraphSONSerializersV2d0(),
+            pool_size=pool_size,
+            max_workers=max_workers,
+        )
+        self.connection = DriverRemoteConnection(
+            url,
+            "g",
+            message_serializer=serializer.GraphSONSerializersV2d0(),
+            pool_size=pool_size,
+            max_workers=max_workers,
         )
+        self.g = traversal().withRemote(self.connection)
 
     def run_query(self, query: str):
         """Run a Gremlin query against Neptune."""
-        callback = self.client.submitAsync(query)
-        if callback.result() is not None:
-            return callback.result().all().result()
+        result_set = self.client.submitAsync(query).result()
+        if result_set is not None:
+            return result_set.all().result()
         return None
 
+    def find_by_description(self, text: str) -> List[Dict[str, Any]]:
+        """Value maps of vertices whose description contains the text."""
+        # Bytecode carries the text as a value, so it is never parsed as Gremlin.
+        return self.g.V().has("description", TextP.containing(text)).valueMap().toList()
+
 
 def create_neptune_app(endpoint: str) -> Flask:
     """Create Flask app for Neptune queries."""
@@ -38,18 +75,17 @@ def create_neptune_app(endpoint: str) -> Flask:
     def query_endpoint():
         data = request.get_json()
         if not data or "prompt" not in data:
-            return jsonify({"error": "Missing 'prompt' in request body"}), 400
+            return json_response(
+                {"error": "Missing 'prompt' in request body"}, status=400
+            )
 
         prompt = data["prompt"]
         try:
-            gremlin_query = (
-                f"g.V().has('description', textContains('{prompt}')).valueMap()"
-            )
-            result = neptune.run_query(gremlin_query)
-            return jsonify({"response": result})
+            result = neptune.find_by_description(prompt)
+            return json_response({"response": result})
         except Exception as e:
             logger.exception("Error processing query")
-            return jsonify({"error": str(e)}), 500
+            return json_response({"error": str(e)}, status=500)
 
     @app.route("/health", methods=["GET"])
     def health():
@@ -1,11 +1,17 @@
 """Secure message broker for inter-agent communication."""
 
 import asyncio
+import contextlib
+import inspect
+import time
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+MESSAGE_BATCH_SIZE = 64
+RATE_LIMIT_RETENTION = 60  # seconds an idle sender's bucket is kept
 
 
 class MessageType(Enum):
@@ -38,30 +44,67 @@ class MessageBroker:
         self.storage = storage
         self.subscribers: Dict[str, Set[Callable]] = defaultdict(set)
         self.message_history: Dict[str, List[SecureMessage]] = defaultdict(list)
-        self.rate_limits: Dict[str, int] = defaultdict(int)
+        # sender_id -> (second bucket, messages sent in that bucket)
+        self.rate_limits: Dict[str, Tuple[int, int]] = {}
         self.max_rate = max_rate
+        self._last_sweep = int(time.monotonic())
         self.message_queue = asyncio.PriorityQueue()
+        self._consumer: Optional[asyncio.Task] = None
 
     async def publish(self, topic: str, message: SecureMessage):
         """Publish a message to a topic."""
         if not self._check_rate_limit(message.sender_id):
             raise ValueError("Rate limit exceeded")
-        if not self.security.verify_signature(message.payload, message.signature):
+        # Serialize once: the same canonical bytes are verified and encrypted.
+        canonical = self.security.canonicalize(message.payload)
+        if not self.security.verify_bytes(canonical, message.signature):
             raise ValueError("Invalid message signature")
 
-        encrypted_payload = self.security.encrypt_message(message.payload)
+        encrypted_payload = self.security.encrypt_bytes(canonical)
         await self.message_queue.put((message.priority, encrypted_payload, message))
-        await self._process_message_queue()
+        self._ensure_consumer()
+
+    def _ensure_consumer(self):
+        """Start the queue consumer on the running loop if it is not running."""
+        if self._consumer is None or self._consumer.done():
+            self._consumer = asyncio.create_task(self._process_message_queue())
 
     async def _process_message_queue(self):
-        """Process messages in priority order."""
-        while not self.message_queue.empty():
-            priority, encrypted_payload, message = await self.message_queue.get()
-            if self._is_message_expired(message):
-                continue
-            self.message_history[message.message_type.value].append(message)
-            await self._notify_subscribers(message)
-            self.message_queue.task_done()
+        """Process messages in priority order, in batches of up to 64."""
+        while True:
+            batch = [await self.message_queue.get()]
+            while len(batch) < MESSAGE_BATCH_SIZE:
+                try:
+                    batch.append(self.message_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            messages = [
+                message
+                for _, _, message in batch
+                if not self._is_message_expired(message)
+            ]
+            by_type: Dict[str, List[SecureMessage]] = defaultdict(list)
+            for message in messages:
+                by_type[message.message_type.value].append(message)
+            for message_type, typed in by_type.items():
+                self.message_history[message_type].extend(typed)
+
+            try:
+                await asyncio.gather(
+                    *[self._notify_subscribers(message) for message in messages]
+                )
+            finally:
+                for _ in batch:
+                    self.message_queue.task_done()
+
+    async def close(self):
+        """Stop the queue consumer."""
+        if self._consumer is not None:
+            self._consumer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._consumer
+            self._consumer = None
 
     def subscribe(self, topic: str, callback: Callable[[SecureMessage], None]):
         """Subscribe to a topic."""
@@ -74,21 +117,55 @@ class MessageBroker:
 
     async def _notify_subscribers(self, message: SecureMessage):
         """Notify all subscribers of a message."""
-        topic = message.message_type.value
-        for subscriber in self.subscribers[topic]:
-            try:
-                await asyncio.create_task(subscriber(message))
-            except Exception as e:
-                print(f"Error delivering to subscriber: {e}")
+        subscribers = tuple(self.subscribers[message.message_type.value])
+        if not subscribers:
+            return
+
+        results = await asyncio.gather(
+            *[self._deliver(subscriber, message) for subscriber in subscribers],
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"Error delivering to subscriber: {result}")
+
+    @staticmethod
+    async def _deliver(subscriber: Callable, message: SecureMessage):
+        """Await async subscribers; run sync ones in the default executor."""
+        if asyncio.iscoroutinefunction(subscriber) or asyncio.iscoroutinefunction(
+            getattr(type(subscriber), "__call__", None)
+        ):
+            return await subscriber(message)
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(None, subscriber, message)
+        # Callables that merely return a coroutine are awaited on the loop.
+        if inspect.isawaitable(result):
+            return await result
+        return result
 
     def _check_rate_limit(self, sender_id: str) -> bool:
-        """Check if sender is within rate limit."""
-        current_rate = self.rate_limits[sender_id]
-        if current_rate >= self.max_rate:
+        """Check if sender is within `max_rate` messages per second."""
+        bucket = int(time.monotonic())
+        if bucket - self._last_sweep >= RATE_LIMIT_RETENTION:
+            self._sweep_rate_limits(bucket)
+        prev_bucket, count = self.rate_limits.get(sender_id, (bucket, 0))
+        if prev_bucket != bucket:
+            count = 0
+        if count >= self.max_rate:
             return False
-        self.rate_limits[sender_id] += 1
+        self.rate_limits[sender_id] = (bucket, count + 1)
         return True
 
+    def _sweep_rate_limits(self, bucket: int):
+        """Drop rate-limit entries for senders idle past the retention window."""
+        cutoff = bucket - RATE_LIMIT_RETENTION
+        self.rate_limits = {
+            sender: entry
+            for sender, entry in self.rate_limits.items()
+            if entry[0] >= cutoff
+        }
+        self._last_sweep = bucket
+
     def _is_message_expired(self, message: SecureMessage) -> bool:
         """Check if message has expired based on TTL."""
         age = (datetime.now() - message.timestamp).total_seconds()
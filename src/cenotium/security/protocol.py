@@ -1,12 +1,13 @@
 """Security protocol for encryption and message signing."""
 
-import hashlib
 import hmac
-import json
 from datetime import datetime
 from typing import Dict
 
-from cryptography.fernet import Fernet
+import orjson
+from cryptography.fernet import Fernet, MultiFernet
+
+CANONICAL_JSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
 
 
 class SecurityProtocol:
@@ -17,27 +18,46 @@ class SecurityProtocol:
         self.cipher_suite = Fernet(self.key)
         self.trusted_keys: Dict[str, bytes] = {}
         self.signing_key = signing_key
+        self.cipher_by_key: Dict[bytes, Fernet] = {self.key: self.cipher_suite}
+        self._any_cipher = MultiFernet([self.cipher_suite])
+
+    @staticmethod
+    def canonicalize(message: dict) -> bytes:
+        """Serialize a message to the canonical bytes that are signed."""
+        return orjson.dumps(message, option=CANONICAL_JSON_OPTIONS)
+
+    def encrypt_bytes(self, message_bytes: bytes) -> bytes:
+        """Encrypt already-serialized message bytes using Fernet."""
+        return self.cipher_suite.encrypt(message_bytes)
 
     def encrypt_message(self, message: dict) -> bytes:
         """Encrypt a dictionary message using Fernet."""
-        message_bytes = json.dumps(message).encode()
-        return self.cipher_suite.encrypt(message_bytes)
+        return self.encrypt_bytes(orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS))
 
     def decrypt_message(self, encrypted_message: bytes) -> dict:
         """Decrypt a Fernet-encrypted message."""
         decrypted_bytes = self.cipher_suite.decrypt(encrypted_message)
-        return json.loads(decrypted_bytes)
+        return orjson.loads(decrypted_bytes)
+
+    def decrypt_with_any(self, encrypted_message: bytes) -> dict:
+        """Decrypt a message encrypted under the current or any rotated-out key."""
+        return orjson.loads(self._any_cipher.decrypt(encrypted_message))
+
+    def sign_bytes(self, message_bytes: bytes) -> str:
+        """Create HMAC-SHA256 signature over canonical message bytes."""
+        return hmac.digest(self.signing_key, message_bytes, "sha256").hex()
 
     def sign_message(self, message: dict) -> str:
         """Create HMAC-SHA256 signature for a message."""
-        message_bytes = json.dumps(message, sort_keys=True).encode()
-        signature = hmac.new(self.signing_key, message_bytes, hashlib.sha256)
-        return signature.hexdigest()
+        return self.sign_bytes(self.canonicalize(message))
+
+    def verify_bytes(self, message_bytes: bytes, signature: str) -> bool:
+        """Verify a signature against canonical message bytes."""
+        return hmac.compare_digest(signature, self.sign_bytes(message_bytes))
 
     def verify_signature(self, message: dict, signature: str) -> bool:
         """Verify a message's digital signature."""
-        expected_signature = self.sign_message(message)
-        return hmac.compare_digest(signature, expected_signature)
+        return self.verify_bytes(self.canonicalize(message), signature)
 
     def rotate_keys(self):
         """Rotate encryption keys for enhanced security."""
@@ -45,3 +65,9 @@ class SecurityProtocol:
         self.trusted_keys[datetime.now().isoformat()] = self.key
         self.key = new_key
         self.cipher_suite = Fernet(new_key)
+        self.cipher_by_key[new_key] = self.cipher_suite
+        # Current key first, then older keys from newest to oldest.
+        self._any_cipher = MultiFernet(
+            [self.cipher_suite]
+            + [self.cipher_by_key[key] for key in reversed(self.trusted_keys.values())]
+        )
@@ -2,28 +2,49 @@
 
 import json
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
+import orjson
 import redis
 
+STORAGE_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize with orjson, falling back to json for values it rejects."""
+    try:
+        return orjson.dumps(value, option=STORAGE_JSON_OPTIONS)
+    except TypeError:
+        # e.g. integers wider than 64 bits, which json.dumps accepts.
+        return json.dumps(value).encode()
+
 
 class PersistentStorage:
     """Manages persistent storage of agent data using Redis."""
 
-    def __init__(self, host: str = "localhost", port: int = 6379, db: int = 0):
-        self.redis_client = redis.Redis(host=host, port=port, db=db)
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        max_connections: int = 32,
+    ):
+        pool = redis.ConnectionPool(
+            host=host, port=port, db=db, max_connections=max_connections
+        )
+        self.redis_client = redis.Redis(connection_pool=pool)
 
     def store_agent_data(self, agent_id: str, data: dict):
         """Store agent-specific data."""
         key = f"agent:{agent_id}"
-        serialized_data = {k: json.dumps(v) for k, v in data.items()}
+        serialized_data = {k: _dumps(v) for k, v in data.items()}
         self.redis_client.hset(key, mapping=serialized_data)
 
     def get_agent_data(self, agent_id: str) -> Dict[str, Any]:
         """Retrieve agent data."""
         key = f"agent:{agent_id}"
         data = self.redis_client.hgetall(key)
-        return {k.decode(): json.loads(v.decode()) for k, v in data.items()}
+        return {k.decode(): orjson.loads(v) for k, v in data.items()}
 
     def store_trust_score(self, agent_id: str, trust_score: float):
         """Store agent trust score."""
@@ -38,21 +59,29 @@ class PersistentStorage:
         score = self.redis_client.get(key)
         return float(score) if score else 0.0
 
+    def get_trust_scores(self, agent_ids: List[str]) -> List[float]:
+        """Retrieve trust scores for several agents in one round trip."""
+        if not agent_ids:
+            return []
+        scores = self.redis_client.mget([f"trust:{agent_id}" for agent_id in agent_ids])
+        return [float(score) if score else 0.0 for score in scores]
+
     def store_transaction(self, transaction_id: str, data: dict, ttl: int = 600):
         """Store transaction data with TTL."""
         key = f"transaction:{transaction_id}"
-        self.redis_client.setex(key, ttl, json.dumps(data))
+        self.redis_client.setex(key, ttl, _dumps(data))
 
     def get_transaction(self, transaction_id: str) -> Optional[dict]:
         """Retrieve transaction data."""
         key = f"transaction:{transaction_id}"
         data = self.redis_client.get(key)
-        return json.loads(data) if data else None
+        return orjson.loads(data) if data else None
 
     def store_agent_metrics(self, agent_id: str, metrics: dict):
         """Store agent performance metrics with time-based scoring."""
         key = f"metrics:{agent_id}"
-        self.redis_client.zadd(key, {json.dumps(metrics): datetime.now().timestamp()})
-        self.redis_client.zremrangebyscore(
-            key, "-inf", datetime.now().timestamp() - 86400
-        )
+        now = datetime.now().timestamp()
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.zadd(key, {_dumps(metrics): now})
+        pipe.zremrangebyscore(key, "-inf", now - 86400)
+        pipe.execute()
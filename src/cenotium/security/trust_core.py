@@ -1,7 +1,7 @@
 """Trust management using EigenTrust algorithm."""
 
-from datetime import datetime
-from typing import Dict, List
+import time
+from typing import Dict, List, Tuple
 
 import numpy as np
 
@@ -16,12 +16,14 @@ class GlobalTrustCore:
         trust_threshold: float = 0.5,
         max_iterations: int = 100,
         time_decay_factor: float = 0.95,
+        convergence_tol: float = 1e-9,
     ):
         self.storage = storage
         self.alpha = alpha
         self.trust_threshold = trust_threshold
         self.max_iterations = max_iterations
         self.time_decay_factor = time_decay_factor
+        self.convergence_tol = convergence_tol
 
     def calculate_trust_score(
         self, agent_id: str, transaction_history: List[dict]
@@ -30,35 +32,39 @@ class GlobalTrustCore:
         if not transaction_history:
             return 0.0
 
-        weighted_transactions = self._apply_time_decay(transaction_history)
+        weights, success, partner_ids = self._apply_time_decay(transaction_history)
 
-        successful = sum(t["weight"] for t in weighted_transactions if t.get("success"))
-        total_weight = sum(t["weight"] for t in weighted_transactions)
-        local_trust = successful / total_weight if total_weight > 0 else 0
+        total_weight = weights.sum()
+        local_trust = weights[success].sum() / total_weight if total_weight > 0 else 0
 
-        neighbor_scores = []
-        for transaction in weighted_transactions:
-            partner_score = self.storage.get_trust_score(transaction["partner_id"])
-            neighbor_scores.append(partner_score * transaction["weight"])
-
-        if not neighbor_scores:
-            return local_trust
+        partner_scores = np.fromiter(
+            self.storage.get_trust_scores(partner_ids),
+            dtype=np.float64,
+            count=len(weights),
+        )
 
-        global_trust = sum(neighbor_scores) / total_weight
+        global_trust = (partner_scores @ weights) / total_weight
         final_trust = self.alpha * local_trust + (1 - self.alpha) * global_trust
-        return max(0.0, min(1.0, final_trust))
-
-    def _apply_time_decay(self, transactions: List[dict]) -> List[dict]:
-        """Apply temporal decay to transaction weights."""
-        now = datetime.now()
-        weighted_transactions = []
-
-        for transaction in transactions:
-            age = now - transaction["timestamp"]
-            weight = self.time_decay_factor ** (age.days + age.seconds / 86400)
-            weighted_transactions.append({**transaction, "weight": weight})
+        return float(max(0.0, min(1.0, final_trust)))
+
+    def _apply_time_decay(
+        self, transactions: List[dict]
+    ) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+        """Apply temporal decay; return weights, success flags and partner ids."""
+        count = len(transactions)
+        timestamps = np.fromiter(
+            (t["timestamp"].timestamp() for t in transactions),
+            dtype=np.float64,
+            count=count,
+        )
+        success = np.fromiter(
+            (bool(t.get("success")) for t in transactions), dtype=bool, count=count
+        )
+        partner_ids = [t["partner_id"] for t in transactions]
 
-        return weighted_transactions
+        ages = (time.time() - timestamps) / 86400.0
+        weights = self.time_decay_factor**ages
+        return weights, success, partner_ids
 
     def calculate_rank(
         self, agent_id: str, trust_score: float, performance_metrics: dict
@@ -87,27 +93,27 @@ class GlobalTrustCore:
         if n == 0:
             return {}
 
-        trust_matrix = np.zeros((n, n))
         agent_ids = list(agents.keys())
 
-        for i, agent_id in enumerate(agent_ids):
-            for j, other_id in enumerate(agent_ids):
-                if i != j:
-                    trust_matrix[i][j] = self.storage.get_trust_score(other_id)
+        # Every row holds the same peer scores, so fetch them once and broadcast.
+        scores = np.array(self.storage.get_trust_scores(agent_ids), dtype=np.float64)
+        trust_matrix = np.broadcast_to(scores, (n, n)).copy()
+        np.fill_diagonal(trust_matrix, 0.0)
 
-        row_sums = trust_matrix.sum(axis=1)
-        trust_matrix = np.divide(
-            trust_matrix,
-            row_sums[:, np.newaxis],
-            where=row_sums[:, np.newaxis] != 0,
-        )
+        row_sums = trust_matrix.sum(axis=1)[:, np.newaxis]
+        np.divide(trust_matrix, row_sums, out=trust_matrix, where=row_sums != 0)
 
-        trust_vector = np.ones(n) / n
+        # Contiguous transpose so each step is a fast-path matrix-vector product.
+        transposed = np.ascontiguousarray(trust_matrix.T)
+        trust_vector = np.full(n, 1.0 / n)
+        new_trust = np.empty(n)
+        delta = np.empty(n)
         for _ in range(self.max_iterations):
-            new_trust = trust_matrix.T @ trust_vector
-            if np.allclose(trust_vector, new_trust):
+            np.dot(transposed, trust_vector, out=new_trust)
+            np.subtract(new_trust, trust_vector, out=delta)
+            trust_vector, new_trust = new_trust, trust_vector
+            if np.abs(delta, out=delta).max() < self.convergence_tol:
                 break
-            trust_vector = new_trust
 
         return {
             agent_id: float(trust_vector[i]) for i, agent_id in enumerate(agent_ids)
@@ -0,0 +1,124 @@
+"""Tests for the LLMCompiler task scheduler."""
+
+import threading
+from typing import List
+
+import pytest
+from langchain_core.messages import FunctionMessage
+from langchain_core.tools import tool
+
+from cenotium.compiler.task_fetching import (
+    UNRESOLVED_DEPENDENCY_ERROR,
+    schedule_tasks,
+)
+
+TIMEOUT = 5
+
+
+def make_task(idx, tool_, args, dependencies=()):
+    return {
+        "idx": idx,
+        "tool": tool_,
+        "args": args,
+        "dependencies": list(dependencies),
+        "thought": None,
+    }
+
+
+@tool
+def echo(text: str) -> str:
+    """Return the text unchanged."""
+    return text
+
+
+@tool
+def join(parts: List[str]) -> str:
+    """Join the parts with spaces."""
+    return " ".join(parts)
+
+
+def run_scheduler(tasks, messages=()):
+    """Run schedule_tasks on a thread so a hang fails the test instead of pytest."""
+    result = {}
+
+    def target():
+        result["messages"] = schedule_tasks(
+            {"messages": list(messages), "tasks": tasks}
+        )
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(TIMEOUT)
+    assert not thread.is_alive(), "schedule_tasks did not return"
+    return {m.additional_kwargs["idx"]: m.content for m in result["messages"]}
+
+
+def test_independent_tasks_run_in_parallel():
+    barrier = threading.Barrier(4, timeout=TIMEOUT)
+
+    @tool
+    def rendezvous(text: str) -> str:
+        """Wait until every independent task is running at once."""
+        barrier.wait()
+        return text
+
+    tasks = [make_task(i, rendezvous, {"text": str(i)}) for i in range(1, 5)]
+    observations = run_scheduler(tasks)
+
+    assert observations == {1: "1", 2: "2", 3: "3", 4: "4"}
+
+
+def test_placeholders_resolve_to_observations():
+    previous = FunctionMessage(
+        name="echo", content="earlier", additional_kwargs={"idx": 0}
+    )
+    tasks = [
+        make_task(1, echo, {"text": "first"}),
+        make_task(2, echo, {"text": "${1} then $0"}, [0, 1]),
+        make_task(3, join, {"parts": ["$2", "plain"]}, [2]),
+    ]
+    observations = run_scheduler(tasks, [previous])
+
+    assert observations[2] == "first then earlier"
+    assert observations[3] == "first then earlier plain"
+    assert 0 not in observations
+
+
+def test_unmet_dependencies_become_errors():
+    tasks = [
+        make_task(1, echo, {"text": "missing"}, [99]),
+        make_task(2, echo, {"text": "$1"}, [1]),
+        make_task(3, echo, {"text": "cycle"}, [4]),
+        make_task(4, echo, {"text": "cycle"}, [3]),
+        make_task(5, echo, {"text": "ok"}),
+    ]
+    observations = run_scheduler(tasks)
+
+    assert list(observations) == [1, 2, 3, 4, 5]
+    for idx in (1, 2, 3, 4):
+        assert observations[idx] == UNRESOLVED_DEPENDENCY_ERROR
+    assert observations[5] == "ok"
+
+
+def test_repeated_idx_replaces_the_waiting_task():
+    tasks = [
+        make_task(2, echo, {"text": "stale $1"}, [1]),
+        make_task(2, echo, {"text": "fresh $1"}, [1]),
+        make_task(1, echo, {"text": "one"}),
+    ]
+    observations = run_scheduler(tasks)
+
+    assert observations == {2: "fresh one", 1: "one"}
+
+
+def test_workers_are_joined_when_the_planner_stream_raises():
+    before = set(threading.enumerate())
+
+    def planner_stream():
+        yield make_task(1, echo, {"text": "partial"})
+        raise RuntimeError("planner failed")
+
+    with pytest.raises(RuntimeError, match="planner failed"):
+        schedule_tasks({"messages": [], "tasks": planner_stream()})
+
+    assert set(threading.enumerate()) <= before
@@ -1,30 +1,29 @@
 """Streamlit UI for Cenotium."""
 
+from textwrap import dedent
+
 import streamlit as st
 from streamlit_option_menu import option_menu
 
+CUSTOM_CSS = """
+<style>
+    body, p, li { font-size: 20px !important; }
+    h1 { font-size: 34px !important; }
+    h2 { font-size: 28px !important; }
+    h3 { font-size: 24px !important; }
+</style>
+"""
 
-def set_custom_css():
-    st.markdown(
-        """
-        <style>
-            body, p, li { font-size: 20px !important; }
-            h1 { font-size: 34px !important; }
-            h2 { font-size: 28px !important; }
-            h3 { font-size: 24px !important; }
-        </style>
-    """,
-        unsafe_allow_html=True,
-    )
 
+def _page(title: str, *sections: str) -> str:
+    """Join a centered title and markdown sections into one block."""
+    header = f"<h1 style='text-align: center;'>{title}</h1>"
+    return "\n\n".join([header, *(dedent(s).strip() for s in sections)])
 
-def home():
-    st.markdown(
-        "<h1 style='text-align: center;'>Cenotium: Agentic Internet Browser</h1>",
-        unsafe_allow_html=True,
-    )
 
-    st.write("""
+HOME_MD = _page(
+    "Cenotium: Agentic Internet Browser",
+    """
     The internet is evolving into a dynamic ecosystem where AI agents operate
     independently, transforming the way tasks are executed, decisions are made,
     and digital interactions take place.
@@ -36,82 +35,80 @@ def home():
     However, today's websites are built for human users, not AI agents. We have
     built a browser designed exclusively for AI agents, reimagining the way they
     access and interact with online information.
-    """)
-
-
-def scraper_page():
-    st.markdown(
-        "<h1 style='text-align: center;'>Web Schema Development</h1>",
-        unsafe_allow_html=True,
-    )
+    """,
+)
 
-    st.write("""
+SCRAPER_MD = _page(
+    "Web Schema Development",
+    """
     The current internet is not designed for AI agents. Websites rely on front-end
     libraries to render content dynamically, making UI elements inaccessible to
     autonomous systems without structured interfaces.
 
     To solve this, we created a custom schema layer that transforms standard web
     pages into structured, interactable formats that AI agents can understand.
-    """)
+    """,
+    "### 1. Planning Model",
+    "Identifies interactive elements using vision-based AI models.",
+    "### 2. Grounding Model (OS-Atlas)",
+    "Maps interaction coordinates using spatial-aware AI models.",
+    "### 3. Action Model",
+    "Executes interactions with identified elements.",
+)
+
+AGENTS_MD = _page(
+    "Agent Architecture",
+    """
+    The Agent Manager is the central hub for receiving prompts, interpreting them,
+    and orchestrating AI-powered agents to execute tasks autonomously.
+    """,
+    "### Available Agents",
+    "**Perplexity Search Agent**: Real-time web searches and knowledge retrieval.",
+    "**Twilio Calling Agent**: Automated outbound calls with AI-generated messages.",
+    "**Browser Activation Agent**: Dynamic web page interaction and automation.",
+)
+
+SECURITY_MD = _page(
+    "Security and Trust",
+    """
+    Our security infrastructure ensures agent-to-agent interactions, data integrity,
+    and trust validation at scale.
+    """,
+    "### Trust System",
+    """
+    - Local Trust: Direct agent-to-agent interactions
+    - Global Trust: Network-wide reputation aggregation
+    - Temporal Decay: Recent transactions weighted higher
+    """,
+    "### Security Protocols",
+    """
+    - Fernet Symmetric Encryption (AES-CBC + HMAC-SHA256)
+    - Rate Limiting and Digital Signatures
+    - Secure Inter-Agent Communication
+    """,
+)
 
-    st.subheader("1. Planning Model")
-    st.write("Identifies interactive elements using vision-based AI models.")
 
-    st.subheader("2. Grounding Model (OS-Atlas)")
-    st.write("Maps interaction coordinates using spatial-aware AI models.")
+def set_custom_css():
+    # Streamlit drops elements a rerun does not emit, so the style tag is sent
+    # on every run; an unchanged element is not re-rendered by the frontend.
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
-    st.subheader("3. Action Model")
-    st.write("Executes interactions with identified elements.")
 
+def home():
+    st.markdown(HOME_MD, unsafe_allow_html=True)
 
-def agents_page():
-    st.markdown(
-        "<h1 style='text-align: center;'>Agent Architecture</h1>",
-        unsafe_allow_html=True,
-    )
 
-    st.write("""
-    The Agent Manager is the central hub for receiving prompts, interpreting them,
-    and orchestrating AI-powered agents to execute tasks autonomously.
-    """)
+def scraper_page():
+    st.markdown(SCRAPER_MD, unsafe_allow_html=True)
 
-    st.subheader("Available Agents")
 
-    st.write(
-        "**Perplexity Search Agent**: Real-time web searches and knowledge retrieval."
-    )
-    st.write(
-        "**Twilio Calling Agent**: Automated outbound calls with AI-generated messages."
-    )
-    st.write(
-        "**Browser Activation Agent**: Dynamic web page interaction and automation."
-    )
+def agents_page():
+    st.markdown(AGENTS_MD, unsafe_allow_html=True)
 
 
 def security_page():
-    st.markdown(
-        "<h1 style='text-align: center;'>Security and Trust</h1>",
-        unsafe_allow_html=True,
-    )
-
-    st.write("""
-    Our security infrastructure ensures agent-to-agent interactions, data integrity,
-    and trust validation at scale.
-    """)
-
-    st.subheader("Trust System")
-    st.write("""
-    - Local Trust: Direct agent-to-agent interactions
-    - Global Trust: Network-wide reputation aggregation
-    - Temporal Decay: Recent transactions weighted higher
-    """)
-
-    st.subheader("Security Protocols")
-    st.write("""
-    - Fernet Symmetric Encryption (AES-CBC + HMAC-SHA256)
-    - Rate Limiting and Digital Signatures
-    - Secure Inter-Agent Communication
-    """)
+    st.markdown(SECURITY_MD, unsafe_allow_html=True)
 
 
 def main():